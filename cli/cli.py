@@ -328,7 +328,9 @@ def cmd_translate(args: argparse.Namespace) -> int:
 
     try:
         start_time = time.perf_counter()
-        translated = backend.translate(args.text, args.source, args.target)
+        translated = manager.translate(
+            args.text, args.source, args.target, model_id=model_id
+        )
         elapsed_time = time.perf_counter() - start_time
         logging.info(f"Translation completed in {elapsed_time:.3f} seconds")
         print(translated)
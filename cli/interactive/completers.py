@@ -11,18 +11,20 @@ class LanguageCompleter(Completer):
 
     def __init__(self, language_codes: dict[str, str]):
         # language_codes: {name: code}
-        self.languages = [(name, code) for name, code in language_codes.items()]
+        # Lowercase once here rather than on every keystroke
+        self.languages = [
+            (name, name.lower(), code, code.lower())
+            for name, code in language_codes.items()
+        ]
 
     def get_completions(self, document, complete_event):
         text = document.text_before_cursor.lower()
-        for name, code in self.languages:
-            display = f"{name} ({code})"
-
-            if text in name.lower() or text in code.lower():
+        for name, name_lower, code, code_lower in self.languages:
+            if text in name_lower or text in code_lower:
                 yield Completion(
                     code,
                     start_position=-len(document.text_before_cursor),
-                    display=display,
+                    display=f"{name} ({code})",
                 )
 
 
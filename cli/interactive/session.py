@@ -19,6 +19,7 @@ from rich.table import Table
 from rich.text import Text
 
 from cli.interactive.completers import CommandCompleter, LanguageCompleter
+from core.languages import get_language_names
 from core.model import (
     DEFAULT_MODEL_ID,
     MODEL_REGISTRY,
@@ -62,7 +63,7 @@ class InteractiveSession:
     def _update_language_codes(self):
         """Update language codes and completer for current model."""
         self.language_codes = self.manager.get_language_codes(self.model_id)
-        self.code_to_name = {v: k for k, v in self.language_codes.items()}
+        self.code_to_name = get_language_names(self.model_id)
         self.lang_completer = LanguageCompleter(self.language_codes)
 
     def _get_language_name(self, code: str) -> str:
@@ -364,8 +365,8 @@ class InteractiveSession:
             with self.console.status(
                 "", spinner="simpleDotsScrolling", spinner_style="white"
             ):
-                translated = backend.translate(
-                    text, self.source_lang, self.target_lang
+                translated = self.manager.translate(
+                    text, self.source_lang, self.target_lang, model_id=self.model_id
                 )
 
             source_name = self._get_language_name(self.source_lang)
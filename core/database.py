@@ -1,51 +1,437 @@
+import atexit
+import functools
 import sqlite3
+import threading
 import uuid
-from datetime import UTC, datetime
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import NamedTuple
 
 DEFAULT_DB_PATH = Path.home() / ".cache" / "bab" / "saved_translations.db"
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+_CREATE_SAVED_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS saved_translations (
+        id BLOB PRIMARY KEY,
+        source_text TEXT NOT NULL,
+        translated_text TEXT NOT NULL,
+        source_lang TEXT NOT NULL,
+        target_lang TEXT NOT NULL,
+        timestamp TEXT NOT NULL
+    )
+"""
+_CREATE_SAVED_INDEXES_SQL = """
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_saved_translations_lookup
+        ON saved_translations (source_lang, target_lang, source_text);
+    CREATE INDEX IF NOT EXISTS idx_saved_translations_recent
+        ON saved_translations (timestamp DESC, id DESC);
+"""
+
+# SQL statements are kept as module constants so every call passes the same
+# text and hits the connection's prepared statement cache.
+_INSERT_SAVED_SQL = """
+    INSERT INTO saved_translations
+        (id, source_text, translated_text, source_lang, target_lang, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+# The no-op DO UPDATE makes RETURNING yield the existing row on conflict
+_INSERT_OR_GET_SAVED_SQL = """
+    INSERT INTO saved_translations
+        (id, source_text, translated_text, source_lang, target_lang, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (source_lang, target_lang, source_text) DO UPDATE SET id = id
+    RETURNING id, source_text, translated_text, source_lang, target_lang, timestamp
+"""
+_SELECT_BY_CONTENT_SQL = """
+    SELECT id, source_text, translated_text, source_lang, target_lang, timestamp
+    FROM saved_translations
+    WHERE source_text = ? AND source_lang = ? AND target_lang = ?
+"""
+# Rows saved together share a timestamp, so the id breaks ties to give every
+# row a stable position for keyset pagination.
+_LIST_ALL_SQL = """
+    SELECT id, source_text, translated_text, source_lang, target_lang, timestamp
+    FROM saved_translations
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+_LIST_BEFORE_SQL = """
+    SELECT id, source_text, translated_text, source_lang, target_lang, timestamp
+    FROM saved_translations
+    WHERE (timestamp, id) < (?, ?)
+    ORDER BY timestamp DESC, id DESC
+    LIMIT ?
+"""
+# Formats ids in SQL exactly as SavedTranslation does, so rows can be
+# serialized without building SavedTranslation objects.
+_LIST_ALL_RAW_SQL = """
+    SELECT
+        lower(
+            substr(hex(id), 1, 8) || '-' || substr(hex(id), 9, 4) || '-'
+            || substr(hex(id), 13, 4) || '-' || substr(hex(id), 17, 4) || '-'
+            || substr(hex(id), 21)
+        ) AS id,
+        source_text,
+        translated_text,
+        source_lang,
+        target_lang,
+        timestamp
+    FROM saved_translations
+    ORDER BY timestamp DESC, saved_translations.id DESC
+"""
+_DELETE_SAVED_SQL = "DELETE FROM saved_translations WHERE id = ?"
+_COUNT_SAVED_SQL = "SELECT COUNT(*) FROM saved_translations"
+# No WHERE clause, so SQLite can use its truncate optimization
+_CLEAR_SAVED_SQL = "DELETE FROM saved_translations"
+
+# Databases already switched to WAL in this process. The journal mode is
+# persistent on the database file, so it only needs to be set once.
+_wal_enabled: set[Path] = set()
+
+# Connections shared by every manager of the same database file, the number of
+# managers holding each, and the locks serializing access to them. In-memory
+# databases are private to one manager.
+_shared_connections: dict[Path, sqlite3.Connection] = {}
+_shared_refcounts: dict[Path, int] = {}
+_shared_locks: dict[Path, threading.Lock] = {}
+_shared_locks_guard = threading.Lock()
+
+# Changes made in this process to each database file. PRAGMA data_version only
+# reports commits from other connections, so managers sharing a connection use
+# this to notice each other's writes.
+_local_changes: dict[Path, int] = {}
+
+
+@atexit.register
+def _close_shared_connections() -> None:
+    """Close the shared connections still open when the interpreter exits."""
+    for conn in _shared_connections.values():
+        conn.close()
+    _shared_connections.clear()
+    _shared_refcounts.clear()
+
+
+def format_timestamp(dt: datetime) -> str:
+    """Format a datetime as the ISO 8601 string stored in the database.
+
+    Timestamps are converted to UTC and always include microseconds, so the
+    strings have a fixed width and sort chronologically. Naive datetimes are
+    assumed to be in UTC.
+    """
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC).isoformat(timespec="microseconds")
+
+
+def from_unix_us(value: int) -> datetime:
+    """Convert Unix time in microseconds to a UTC datetime."""
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """Open a connection to the SQLite database with tuned PRAGMAs.
+
+    The connection runs in autocommit mode and may be shared across threads,
+    so callers are responsible for serializing access to it.
+
+    Args:
+        db_path: Path to the SQLite database file.
+
+    Returns:
+        A configured SQLite connection.
+    """
+    conn = sqlite3.connect(
+        db_path,
+        check_same_thread=False,
+        isolation_level=None,
+    )
+
+    if str(db_path) != ":memory:" and db_path not in _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled.add(db_path)
+
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    conn.execute("PRAGMA busy_timeout=5000")
+    return conn
+
 
 class SavedTranslation(NamedTuple):
-    id: str
+    id: str  # UUID string; stored as 16 raw bytes in the database
     source_text: str
     translated_text: str
     source_lang: str
     target_lang: str
-    timestamp: str  # ISO 8601 format
+    timestamp: str  # ISO 8601 in UTC, as returned to clients
 
+    @classmethod
+    def from_row(cls, row: tuple) -> "SavedTranslation":
+        """Build a SavedTranslation from a database row."""
+        return cls(str(uuid.UUID(bytes=row[0])), *row[1:])
+
+
+class SQLiteManager:
+    """Base class for managers that persist to the SQLite database.
+
+    Subclasses provide their schema in ``_SCHEMA``. The connection is opened
+    lazily and shared by every manager of the same database file, so they
+    share one page cache. Access to it is serialized by a per-file lock.
+    """
+
+    _SCHEMA: str = ""
+    # Identifies the schema in its sentinel file; bump the version whenever
+    # the schema or its migrations change so existing databases are upgraded.
+    _SCHEMA_NAME: str = ""
+    _SCHEMA_VERSION: int = 1
 
-class SavedTranslationManager:
     def __init__(self, db_path: Path | str | None = None) -> None:
-        """Initialize the SavedTranslationManager.
+        """Initialize the manager.
 
         Args:
             db_path: Path to the SQLite database file. If None, uses the default path.
         """
         self._db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self._shared = str(self._db_path) != ":memory:"
+        self._conn: sqlite3.Connection | None = None
+        # Database version the subclass caches were last validated against
+        self._cache_version: tuple[int, int] | None = None
+        if self._shared:
+            with _shared_locks_guard:
+                self._lock = _shared_locks.setdefault(self._db_path, threading.Lock())
+        else:
+            self._lock = threading.Lock()
         self._ensure_database()
 
     def _ensure_database(self) -> None:
-        """Ensure the database and table exist."""
+        """Ensure the database and schema exist.
+
+        A sentinel file next to the database records that the current schema
+        version was applied, so later startups skip opening the database.
+        """
+        sentinel = self._db_path.with_name(
+            f".{self._db_path.name}.{self._SCHEMA_NAME}.v{self._SCHEMA_VERSION}"
+        )
+        if sentinel.exists() and self._db_path.exists():
+            return
+
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with self._get_connection() as conn:
+        with self._lock:
+            self._create_schema(self._get_connection())
+
+        if str(self._db_path) != ":memory:":
+            sentinel.touch()
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the tables and indexes if they don't exist."""
+        conn.executescript(self._SCHEMA).close()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the database connection, opening it on first use.
+
+        The caller must hold ``_lock``.
+        """
+        if self._conn is not None:
+            return self._conn
+
+        if not self._shared:
+            self._conn = connect(self._db_path)
+            return self._conn
+
+        conn = _shared_connections.get(self._db_path)
+        if conn is None:
+            conn = _shared_connections[self._db_path] = connect(self._db_path)
+        _shared_refcounts[self._db_path] = _shared_refcounts.get(self._db_path, 0) + 1
+        self._conn = conn
+        return conn
+
+    def _clear_caches(self) -> None:
+        """Drop cached query results. Subclasses that cache results override this."""
+
+    def _record_change(self) -> None:
+        """Invalidate cached query results after a write.
+
+        The caller must hold ``_lock``.
+        """
+        _local_changes[self._db_path] = _local_changes.get(self._db_path, 0) + 1
+        self._clear_caches()
+
+    def _validate_caches(self) -> None:
+        """Drop cached query results if the database changed since they were read.
+
+        Commits from other processes are detected through PRAGMA data_version,
+        and writes by other managers in this process through a change counter.
+        The caller must hold ``_lock``.
+        """
+        cursor = self._get_connection().execute("PRAGMA data_version")
+        (data_version,) = cursor.fetchone()
+        cursor.close()
+        version = (data_version, _local_changes.get(self._db_path, 0))
+        if version != self._cache_version:
+            self._cache_version = version
+            self._clear_caches()
+
+    def close(self) -> None:
+        """Release the database connection.
+
+        A shared connection stays open until every manager of the file has
+        released it. The manager reopens it on its next query.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            if self._shared:
+                remaining = _shared_refcounts[self._db_path] - 1
+                if remaining:
+                    _shared_refcounts[self._db_path] = remaining
+                else:
+                    del _shared_refcounts[self._db_path]
+                    del _shared_connections[self._db_path]
+                    # A reopened connection restarts data_version, so count
+                    # the close as a change to keep caches from being trusted.
+                    self._record_change()
+                    self._conn.close()
+            else:
+                self._conn.close()
+            self._conn = None
+
+
+class SavedTranslationManager(SQLiteManager):
+    _SCHEMA = _CREATE_SAVED_TABLE_SQL + ";" + _CREATE_SAVED_INDEXES_SQL
+    _SCHEMA_NAME = "saved_translations"
+    _SCHEMA_VERSION = 4
+
+    def __init__(self, db_path: Path | str | None = None) -> None:
+        """Initialize the SavedTranslationManager.
+
+        Args:
+            db_path: Path to the SQLite database file. If None, uses the default path.
+        """
+        super().__init__(db_path)
+        # Caches misses too, so repeated lookups of unsaved text skip the
+        # query. Validated against the database version on every lookup.
+        self._find_cache = functools.lru_cache(maxsize=128)(self._find_by_content)
+
+    def _clear_caches(self) -> None:
+        """Drop cached content lookups."""
+        self._find_cache.cache_clear()
+
+    def _create_schema(self, conn: sqlite3.Connection) -> None:
+        """Create the table and indexes, migrating older schemas.
+
+        Indexes are created last, once migrations have removed rows that would
+        violate the unique content index.
+        """
+        conn.execute(_CREATE_SAVED_TABLE_SQL).close()
+        self._migrate_schema(conn)
+        self._deduplicate(conn)
+        # Replaced by idx_saved_translations_recent
+        conn.execute("DROP INDEX IF EXISTS idx_saved_translations_timestamp").close()
+        conn.executescript(_CREATE_SAVED_INDEXES_SQL).close()
+
+    def _migrate_schema(self, conn: sqlite3.Connection) -> None:
+        """Convert columns written by older versions to the current formats.
+
+        UUID string ids are converted to 16-byte BLOBs, and Unix microsecond
+        timestamps to ISO 8601 strings. ISO timestamps written before they
+        were fixed-width are normalized so they sort chronologically.
+        """
+        conn.create_function(
+            "uuid_to_bytes",
+            1,
+            lambda value: uuid.UUID(value).bytes,
+            deterministic=True,
+        )
+        conn.create_function(
+            "unix_us_to_iso",
+            1,
+            lambda value: format_timestamp(from_unix_us(value)),
+            deterministic=True,
+        )
+        conn.create_function(
+            "normalize_iso",
+            1,
+            lambda value: format_timestamp(datetime.fromisoformat(value)),
+            deterministic=True,
+        )
+
+        columns = {
+            row[1]: row[2]
+            for row in conn.execute("PRAGMA table_info(saved_translations)")
+        }
+        id_expr = "uuid_to_bytes(id)" if columns.get("id") == "TEXT" else "id"
+        timestamp_expr = (
+            "unix_us_to_iso(timestamp)"
+            if columns.get("timestamp") == "INTEGER"
+            else "timestamp"
+        )
+        if id_expr != "id" or timestamp_expr != "timestamp":
+            self._rebuild_table(conn, id_expr, timestamp_expr)
+
+        # Fixed-width timestamps are 32 characters long
+        conn.execute("""
+            UPDATE saved_translations SET timestamp = normalize_iso(timestamp)
+            WHERE length(timestamp) != 32
+        """).close()
+
+    def _rebuild_table(
+        self,
+        conn: sqlite3.Connection,
+        id_expr: str,
+        timestamp_expr: str,
+    ) -> None:
+        """Copy every row into a new table, converting the id and timestamp."""
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DROP INDEX IF EXISTS idx_saved_translations_lookup")
+            conn.execute("DROP INDEX IF EXISTS idx_saved_translations_timestamp")
+            conn.execute("DROP INDEX IF EXISTS idx_saved_translations_recent")
+            conn.execute(
+                "ALTER TABLE saved_translations RENAME TO saved_translations_old"
+            )
+            conn.execute(_CREATE_SAVED_TABLE_SQL)
+            conn.execute(f"""
+                INSERT INTO saved_translations
+                SELECT {id_expr}, source_text, translated_text, source_lang,
+                    target_lang, {timestamp_expr}
+                FROM saved_translations_old
+            """)
+            conn.execute("DROP TABLE saved_translations_old")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _deduplicate(self, conn: sqlite3.Connection) -> None:
+        """Remove duplicate entries left by databases without a unique index.
+
+        The oldest entry for each source text and language pair is kept, and
+        the non-unique lookup index is dropped so it can be recreated unique.
+        """
+        unique = {
+            row[1]: bool(row[2])
+            for row in conn.execute("PRAGMA index_list(saved_translations)")
+        }
+        if unique.get("idx_saved_translations_lookup"):
+            return
+
+        conn.execute("BEGIN")
+        try:
+            conn.execute("DROP INDEX IF EXISTS idx_saved_translations_lookup")
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS saved_translations (
-                    id TEXT PRIMARY KEY,
-                    source_text TEXT NOT NULL,
-                    translated_text TEXT NOT NULL,
-                    source_lang TEXT NOT NULL,
-                    target_lang TEXT NOT NULL,
-                    timestamp TEXT NOT NULL
+                DELETE FROM saved_translations
+                WHERE rowid NOT IN (
+                    SELECT min(rowid) FROM saved_translations
+                    GROUP BY source_lang, target_lang, source_text
                 )
             """)
-            conn.commit()
-
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        return sqlite3.connect(self._db_path)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
 
     def create(
         self,
@@ -64,36 +450,97 @@ class SavedTranslationManager:
 
         Returns:
             The created SavedTranslation.
+
+        Raises:
+            sqlite3.IntegrityError: If an entry with the same source text and
+                language pair already exists. Use create_or_get to reuse it.
         """
-        item_id = str(uuid.uuid4())
-        timestamp = datetime.now(UTC).isoformat()
+        return self.create_many(
+            [(source_text, translated_text, source_lang, target_lang)]
+        )[0]
 
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO saved_translations (id, source_text, translated_text, source_lang, target_lang, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    item_id,
-                    source_text,
-                    translated_text,
-                    source_lang,
-                    target_lang,
-                    timestamp,
-                ),
+    def create_many(
+        self,
+        rows: list[tuple[str, str, str, str]],
+    ) -> list[SavedTranslation]:
+        """Create several saved translation entries in a single transaction.
+
+        Args:
+            rows: Tuples of (source_text, translated_text, source_lang,
+                target_lang) to insert.
+
+        Returns:
+            The created SavedTranslations, in the same order as ``rows``.
+
+        Raises:
+            sqlite3.IntegrityError: If a row has the same source text and
+                language pair as an existing entry. Nothing is inserted.
+        """
+        timestamp = format_timestamp(datetime.now(UTC))
+        params = [
+            (
+                uuid.uuid4().bytes,
+                source_text,
+                translated_text,
+                source_lang,
+                target_lang,
+                timestamp,
             )
-            conn.commit()
-
-        return SavedTranslation(
-            id=item_id,
-            source_text=source_text,
-            translated_text=translated_text,
-            source_lang=source_lang,
-            target_lang=target_lang,
-            timestamp=timestamp,
+            for source_text, translated_text, source_lang, target_lang in rows
+        ]
+
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(_INSERT_SAVED_SQL, params).close()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._record_change()
+
+        return [SavedTranslation.from_row(row) for row in params]
+
+    def create_or_get(
+        self,
+        source_text: str,
+        translated_text: str,
+        source_lang: str,
+        target_lang: str,
+    ) -> SavedTranslation:
+        """Save a translation unless one with the same content already exists.
+
+        Runs as a single statement, so concurrent calls cannot create
+        duplicates.
+
+        Args:
+            source_text: The original text.
+            translated_text: The translated text.
+            source_lang: Source language NLLB code.
+            target_lang: Target language NLLB code.
+
+        Returns:
+            The created SavedTranslation, or the existing one with the same
+            source text and language pair.
+        """
+        params = (
+            uuid.uuid4().bytes,
+            source_text,
+            translated_text,
+            source_lang,
+            target_lang,
+            format_timestamp(datetime.now(UTC)),
         )
 
+        with self._lock:
+            cursor = self._get_connection().execute(_INSERT_OR_GET_SAVED_SQL, params)
+            row = cursor.fetchone()
+            cursor.close()
+            self._record_change()
+
+        return SavedTranslation.from_row(row)
+
     def find_by_content(
         self,
         source_text: str,
@@ -110,18 +557,26 @@ class SavedTranslationManager:
         Returns:
             The matching SavedTranslation if found, None otherwise.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, source_text, translated_text, source_lang, target_lang, timestamp
-                FROM saved_translations
-                WHERE source_text = ? AND source_lang = ? AND target_lang = ?
-                """,
+        with self._lock:
+            self._validate_caches()
+        return self._find_cache(source_text, source_lang, target_lang)
+
+    def _find_by_content(
+        self,
+        source_text: str,
+        source_lang: str,
+        target_lang: str,
+    ) -> SavedTranslation | None:
+        """Query the database for a saved translation, bypassing the cache."""
+        with self._lock:
+            cursor = self._get_connection().execute(
+                _SELECT_BY_CONTENT_SQL,
                 (source_text, source_lang, target_lang),
             )
             row = cursor.fetchone()
+            cursor.close()
 
-        return SavedTranslation(*row) if row else None
+        return SavedTranslation.from_row(row) if row else None
 
     def list_all(self) -> list[SavedTranslation]:
         """List all saved translations, sorted by timestamp (newest first).
@@ -129,17 +584,76 @@ class SavedTranslationManager:
         Returns:
             List of SavedTranslation objects.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, source_text, translated_text, source_lang, target_lang, timestamp
-                FROM saved_translations
-                ORDER BY timestamp DESC
-                """
-            )
-            rows = cursor.fetchall()
+        return list(self.iter_all())
 
-        return [SavedTranslation(*row) for row in rows]
+    def list_all_raw(self) -> list[dict[str, str]]:
+        """List all saved translations as plain dicts, newest first.
+
+        Ids are formatted by SQLite and timestamps are stored as returned, so
+        this is the cheapest way to serialize the whole table. Each dict has
+        the same keys and values as the corresponding SavedTranslation.
+
+        Returns:
+            List of dicts keyed by column name.
+        """
+        with self._lock:
+            cursor = self._get_connection().cursor()
+            cursor.row_factory = sqlite3.Row
+            rows = cursor.execute(_LIST_ALL_RAW_SQL).fetchall()
+            cursor.close()
+
+        return [dict(row) for row in rows]
+
+    def iter_all(
+        self,
+        limit: int | None = None,
+        before_ts: str | None = None,
+        before_id: str | None = None,
+    ) -> Iterator[SavedTranslation]:
+        """Iterate over saved translations, sorted by timestamp (newest first).
+
+        Entries with the same timestamp are ordered by id, so pages never skip
+        or repeat entries saved together. Rows are fetched from the database in
+        small batches as the iterator is consumed. The connection lock is only
+        held while fetching, so other threads are not blocked by a slow
+        consumer. ``vacuum`` fails while an iterator is open; exhaust or close
+        it first.
+
+        Args:
+            limit: Maximum number of entries to yield. If None, yields all.
+            before_ts: If set, only yields entries after this ISO 8601
+                timestamp in iteration order.
+            before_id: The id of the entry at ``before_ts`` to continue after.
+                Pass the last seen ``timestamp`` and ``id`` to fetch the next
+                page. If None, every entry at ``before_ts`` is skipped.
+
+        Yields:
+            SavedTranslation objects.
+        """
+        # SQLite treats a negative LIMIT as no limit
+        sql_limit = -1 if limit is None else limit
+
+        with self._lock:
+            if before_ts is None:
+                cursor = self._get_connection().execute(_LIST_ALL_SQL, (sql_limit,))
+            else:
+                # No id sorts below the empty BLOB, so this skips the whole tie
+                id_bytes = uuid.UUID(before_id).bytes if before_id else b""
+                cursor = self._get_connection().execute(
+                    _LIST_BEFORE_SQL,
+                    (before_ts, id_bytes, sql_limit),
+                )
+
+        try:
+            while True:
+                with self._lock:
+                    rows = cursor.fetchmany(100)
+                if not rows:
+                    break
+                for row in rows:
+                    yield SavedTranslation.from_row(row)
+        finally:
+            cursor.close()
 
     def delete(self, item_id: str) -> bool:
         """Delete a saved translation by ID.
@@ -150,13 +664,20 @@ class SavedTranslationManager:
         Returns:
             True if an entry was deleted, False if no entry was found.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "DELETE FROM saved_translations WHERE id = ?",
-                (item_id,),
+        try:
+            item_id_bytes = uuid.UUID(item_id).bytes
+        except ValueError:
+            return False
+
+        with self._lock:
+            cursor = self._get_connection().execute(
+                _DELETE_SAVED_SQL,
+                (item_id_bytes,),
             )
-            conn.commit()
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+            cursor.close()
+            self._record_change()
+            return deleted
 
     def clear_all(self) -> int:
         """Delete all saved translations.
@@ -164,22 +685,31 @@ class SavedTranslationManager:
         Returns:
             The number of entries deleted.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute("DELETE FROM saved_translations")
-            conn.commit()
-            return cursor.rowcount
-
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("BEGIN")
+            try:
+                # rowcount is unreliable for truncate-optimized deletes
+                (count,) = conn.execute(_COUNT_SAVED_SQL).fetchone()
+                conn.execute(_CLEAR_SAVED_SQL).close()
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self._record_change()
+            return count
 
-_saved_translation_manager: SavedTranslationManager | None = None
+    def vacuum(self) -> None:
+        """Rebuild the database file to reclaim space freed by deletions."""
+        with self._lock:
+            self._get_connection().execute("VACUUM").close()
 
 
+@functools.cache
 def get_saved_translation_manager() -> SavedTranslationManager:
     """Get the global SavedTranslationManager instance.
 
     Returns:
         The global SavedTranslationManager singleton.
     """
-    global _saved_translation_manager
-    if _saved_translation_manager is None:
-        _saved_translation_manager = SavedTranslationManager()
-    return _saved_translation_manager
+    return SavedTranslationManager()
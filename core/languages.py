@@ -4,6 +4,10 @@ This module contains language code dictionaries for different translation models
 Each model has its own language code format and supported language set.
 """
 
+import functools
+from collections.abc import Mapping
+from types import MappingProxyType
+
 # NLLB-200 language codes (BCP-47 style with script tags)
 # Full list of 200+ languages supported by facebook/nllb-200-distilled-600M
 NLLB_LANGUAGE_CODES: dict[str, str] = {
@@ -293,3 +297,57 @@ def get_language_codes(model_id: str) -> dict[str, str]:
         return TRANSLATEGEMMA_LANGUAGE_CODES
     else:
         raise ValueError(f"Unknown model_id: {model_id}")
+
+
+@functools.cache
+def get_language_names(model_id: str) -> Mapping[str, str]:
+    """Get the reverse mapping of language codes to names for a specific model.
+
+    The mapping is built once per model and shared by all callers.
+
+    Args:
+        model_id: The model identifier ('nllb' or 'translategemma').
+
+    Returns:
+        Read-only mapping of language codes to their names.
+
+    Raises:
+        ValueError: If the model_id is not recognized.
+    """
+    codes = get_language_codes(model_id)
+    return MappingProxyType({code: name for name, code in codes.items()})
+
+
+@functools.cache
+def get_valid_language_codes(model_id: str) -> frozenset[str]:
+    """Get the set of language codes accepted by a specific model.
+
+    Built once per model so request validation is a pair of set lookups.
+
+    Args:
+        model_id: The model identifier ('nllb' or 'translategemma').
+
+    Returns:
+        Frozen set of the model's language codes.
+
+    Raises:
+        ValueError: If the model_id is not recognized.
+    """
+    return frozenset(get_language_codes(model_id).values())
+
+
+@functools.cache
+def get_sorted_language_codes(model_id: str) -> Mapping[str, str]:
+    """Get the language name to code mapping for a model, sorted by name.
+
+    Args:
+        model_id: The model identifier ('nllb' or 'translategemma').
+
+    Returns:
+        Read-only mapping of language names to codes in alphabetical order.
+
+    Raises:
+        ValueError: If the model_id is not recognized.
+    """
+    codes = get_language_codes(model_id)
+    return MappingProxyType(dict(sorted(codes.items())))
@@ -7,19 +7,28 @@ This module handles:
 - Keeping them in memory for reuse
 """
 
+import bisect
+import functools
 import logging
+import os
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import Executor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from huggingface_hub import snapshot_download
-
+from core.database import get_saved_translation_manager
 from core.languages import (
     NLLB_LANGUAGE_CODES,
     get_language_codes,
 )
 
 if TYPE_CHECKING:
+    import ctranslate2
+    import torch
     from transformers import (
         AutoModelForImageTextToText,
         AutoModelForSeq2SeqLM,
@@ -29,6 +38,19 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Inputs longer than this many tokens are truncated
+MAX_INPUT_TOKENS = 512
+
+# Upper bounds of the token-length buckets batched inputs are grouped into
+LENGTH_BUCKETS = (16, 32, 64, 128, 256, MAX_INPUT_TOKENS)
+
+# Maximum number of translations memoized in process by ModelManager
+TRANSLATION_CACHE_SIZE = 10_000
+
+# Serve NLLB through CTranslate2 instead of transformers. Requires the optional
+# ctranslate2 dependency; set BAB_USE_CTRANSLATE2=1 to enable.
+USE_CTRANSLATE2 = os.environ.get("BAB_USE_CTRANSLATE2") == "1"
+
 # Default cache directory for all models
 DEFAULT_CACHE_DIR = Path.home() / ".cache" / "bab" / "models"
 
@@ -96,6 +118,19 @@ MODEL_REGISTRY: dict[str, ModelInfo] = {
 DEFAULT_MODEL_ID = "nllb"
 
 
+def _select_torch_dtype() -> "torch.dtype":
+    """Pick the narrowest floating point type the current device runs well.
+
+    CUDA devices use bfloat16 when supported and float16 otherwise. CPUs stay
+    on float32, since half precision matmuls are emulated on most of them.
+    """
+    import torch
+
+    if torch.cuda.is_available():
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+    return torch.float32
+
+
 def get_available_models() -> list[ModelInfo]:
     """Get list of all available models."""
     return list(MODEL_REGISTRY.values())
@@ -127,7 +162,10 @@ class TranslationBackend(ABC):
     def __init__(self, model_info: ModelInfo, cache_dir: Path):
         self._model_info = model_info
         self._cache_dir = cache_dir
+        self._model_path: Path | None = None
         self._is_loaded = False
+        # Serializes load/unload so concurrent callers load the model only once
+        self._load_lock = threading.Lock()
 
     @property
     def model_info(self) -> ModelInfo:
@@ -143,11 +181,16 @@ class TranslationBackend(ABC):
     def cache_dir(self, path: Path | str) -> None:
         """Set the cache directory path."""
         self._cache_dir = Path(path)
+        self._model_path = None
 
     @property
     def model_path(self) -> Path:
         """Get the full path to the model directory."""
-        return self._cache_dir / self._model_info.repo_id.replace("/", "--")
+        if self._model_path is None:
+            self._model_path = self._cache_dir / self._model_info.repo_id.replace(
+                "/", "--"
+            )
+        return self._model_path
 
     @property
     def is_loaded(self) -> bool:
@@ -176,7 +219,7 @@ class TranslationBackend(ABC):
             RuntimeError: If download fails.
         """
         if self.is_downloaded and not force:
-            logger.info(f"Model already downloaded at {self.model_path}")
+            logger.debug(f"Model already downloaded at {self.model_path}")
             return self.model_path
 
         logger.info(
@@ -184,14 +227,16 @@ class TranslationBackend(ABC):
         )
 
         try:
+            from huggingface_hub import snapshot_download
+
             # Ensure cache directory exists
             self._cache_dir.mkdir(parents=True, exist_ok=True)
 
             # Download model snapshot
+            # Files already present in local_dir are skipped by the hub client
             downloaded_path = snapshot_download(
                 repo_id=self._model_info.repo_id,
                 local_dir=self.model_path,
-                local_dir_use_symlinks=False,
             )
 
             logger.info(f"Model downloaded successfully to {downloaded_path}")
@@ -235,6 +280,11 @@ class TranslationBackend(ABC):
                 f"Failed to delete model at {self.model_path}: {e}"
             ) from e
 
+    def _ensure_downloaded(self) -> None:
+        """Download the model before loading it, unless it is already present."""
+        if not self.is_downloaded:
+            self.download_model()
+
     @abstractmethod
     def load_model(self) -> Any:
         """Load the model into memory."""
@@ -250,6 +300,42 @@ class TranslationBackend(ABC):
         """Translate text between languages."""
         pass
 
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        """Translate several texts that share a language pair.
+
+        Backends that can run a padded batch through the model override this;
+        the default translates each text in turn.
+        """
+        return [self.translate(text, source_lang, target_lang) for text in texts]
+
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        executor: Executor | None = None,
+    ) -> Iterator[str]:
+        """Translate text, yielding the translation in pieces as it is decoded.
+
+        Backends that can stream tokens from the model override this; the
+        default yields the whole translation at once.
+
+        Args:
+            text: The text to translate.
+            source_lang: Source language code.
+            target_lang: Target language code.
+            executor: Executor to run generation on, so it is serialized with
+                other model calls. If None, runs in the calling thread.
+        """
+        if executor is None:
+            yield self.translate(text, source_lang, target_lang)
+        else:
+            yield executor.submit(
+                self.translate, text, source_lang, target_lang
+            ).result()
+
     @abstractmethod
     def verify_model_files(self) -> dict[str, bool]:
         """Verify that all necessary model files are present."""
@@ -267,6 +353,9 @@ class NLLBBackend(TranslationBackend):
         super().__init__(MODEL_REGISTRY["nllb"], cache_dir)
         self._model: AutoModelForSeq2SeqLM | None = None
         self._tokenizer: AutoTokenizer | None = None
+        # Token id of each language code, used as the forced BOS token.
+        # Filled for every supported language when the tokenizer loads.
+        self._lang_token_ids: dict[str, int] = {}
 
     def load_model(self) -> tuple["AutoModelForSeq2SeqLM", "AutoTokenizer"]:
         """Load the model and tokenizer into memory."""
@@ -274,11 +363,22 @@ class NLLBBackend(TranslationBackend):
             logger.debug("Returning cached model and tokenizer")
             return self._model, self._tokenizer
 
+        with self._load_lock:
+            # Another thread may have finished loading while we waited
+            if (
+                self._is_loaded
+                and self._model is not None
+                and self._tokenizer is not None
+            ):
+                return self._model, self._tokenizer
+            return self._load()
+
+    def _load(self) -> tuple["AutoModelForSeq2SeqLM", "AutoTokenizer"]:
+        """Load the model and tokenizer. The caller must hold _load_lock."""
+        import torch
         from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
 
-        if not self.is_downloaded:
-            logger.info("Model not found locally, downloading...")
-            self.download_model()
+        self._ensure_downloaded()
 
         logger.info(f"Loading model from {self.model_path}")
 
@@ -288,11 +388,22 @@ class NLLBBackend(TranslationBackend):
                 local_files_only=True,
             )
             logger.info("Tokenizer loaded successfully")
+            self._lang_token_ids = dict(
+                zip(
+                    NLLB_LANGUAGE_CODES.values(),
+                    tokenizer.convert_tokens_to_ids(list(NLLB_LANGUAGE_CODES.values())),
+                    strict=True,
+                )
+            )
 
             model: AutoModelForSeq2SeqLM = AutoModelForSeq2SeqLM.from_pretrained(
                 self.model_path,
                 local_files_only=True,
+                torch_dtype=_select_torch_dtype(),
+                low_cpu_mem_usage=True,
             )
+            if torch.cuda.is_available():
+                model = model.to("cuda")
             logger.info("Model loaded successfully")
 
             self._model = model
@@ -312,28 +423,132 @@ class NLLBBackend(TranslationBackend):
 
     def unload_model(self) -> None:
         """Unload the model from memory to free resources."""
-        if self._model is not None:
-            del self._model
-            self._model = None
+        with self._load_lock:
+            if self._model is not None:
+                del self._model
+                self._model = None
 
-        if self._tokenizer is not None:
-            del self._tokenizer
-            self._tokenizer = None
+            if self._tokenizer is not None:
+                del self._tokenizer
+                self._tokenizer = None
 
-        self._is_loaded = False
+            self._lang_token_ids.clear()
+            self._is_loaded = False
         logger.info("Model unloaded from memory")
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
         """Translate text between languages using NLLB codes."""
+        return self.translate_batch([text], source_lang, target_lang)[0]
+
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        """Translate several texts, one padded generate call per length bucket.
+
+        Texts are grouped by token length so short inputs are not padded to the
+        length of a long one sharing the batch.
+        """
+        import torch
+
         model, tokenizer = self.load_model()
-        tokenizer.src_lang = source_lang
-        inputs = tokenizer(text, return_tensors="pt")
-        translated_tokens = model.generate(
-            **inputs,
-            forced_bos_token_id=tokenizer.convert_tokens_to_ids(target_lang),
-            max_length=512,
+        # Setting src_lang rebuilds the tokenizer's special tokens
+        if tokenizer.src_lang != source_lang:
+            tokenizer.src_lang = source_lang
+
+        bos_id = self._lang_token_ids.get(target_lang)
+        if bos_id is None:
+            bos_id = tokenizer.convert_tokens_to_ids(target_lang)
+            self._lang_token_ids[target_lang] = bos_id
+
+        input_ids = tokenizer(
+            texts,
+            truncation=True,
+            max_length=MAX_INPUT_TOKENS,
+        )["input_ids"]
+
+        buckets: dict[int, list[int]] = {}
+        for i, ids in enumerate(input_ids):
+            bucket = bisect.bisect_left(LENGTH_BUCKETS, len(ids))
+            buckets.setdefault(bucket, []).append(i)
+
+        results: list[str] = [""] * len(texts)
+        for indices in buckets.values():
+            inputs = tokenizer.pad(
+                {"input_ids": [input_ids[i] for i in indices]},
+                return_tensors="pt",
+            ).to(model.device)
+
+            with torch.inference_mode():
+                translated_tokens = model.generate(
+                    **inputs,
+                    forced_bos_token_id=bos_id,
+                    max_length=MAX_INPUT_TOKENS,
+                    num_beams=1,
+                )
+            decoded = tokenizer.batch_decode(
+                translated_tokens, skip_special_tokens=True
+            )
+            for i, translation in zip(indices, decoded, strict=True):
+                results[i] = translation
+        return results
+
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        executor: Executor | None = None,
+    ) -> Iterator[str]:
+        """Translate text, yielding decoded pieces as the model generates them."""
+        import torch
+        from transformers import TextIteratorStreamer
+
+        model, tokenizer = self.load_model()
+        bos_id = self._lang_token_ids.get(target_lang)
+        if bos_id is None:
+            bos_id = tokenizer.convert_tokens_to_ids(target_lang)
+            self._lang_token_ids[target_lang] = bos_id
+
+        streamer = TextIteratorStreamer(
+            tokenizer, skip_prompt=True, skip_special_tokens=True
         )
-        return tokenizer.batch_decode(translated_tokens, skip_special_tokens=True)[0]
+        errors: list[Exception] = []
+
+        def generate() -> None:
+            try:
+                # Tokenize on the generation thread so src_lang is not changed
+                # under a batch running on the same executor
+                if tokenizer.src_lang != source_lang:
+                    tokenizer.src_lang = source_lang
+                inputs = tokenizer(
+                    text,
+                    return_tensors="pt",
+                    truncation=True,
+                    max_length=MAX_INPUT_TOKENS,
+                ).to(model.device)
+                with torch.inference_mode():
+                    model.generate(
+                        **inputs,
+                        forced_bos_token_id=bos_id,
+                        max_length=MAX_INPUT_TOKENS,
+                        num_beams=1,
+                        streamer=streamer,
+                    )
+            except Exception as e:
+                errors.append(e)
+                # Unblock the consumer waiting on the streamer
+                streamer.end()
+
+        if executor is None:
+            threading.Thread(target=generate, daemon=True).start()
+        else:
+            executor.submit(generate)
+
+        for piece in streamer:
+            if piece:
+                yield piece
+        if errors:
+            raise errors[0]
 
     def verify_model_files(self) -> dict[str, bool]:
         """Verify that all necessary model files are present."""
@@ -373,6 +588,150 @@ class NLLBBackend(TranslationBackend):
         return self._tokenizer  # type: ignore[return-value]
 
 
+class CTranslate2NLLBBackend(NLLBBackend):
+    """Backend running NLLB through CTranslate2.
+
+    The Hugging Face snapshot is converted once to CTranslate2's format in a
+    sibling ``_ct2`` directory. CTranslate2 picks the fastest compute type the
+    device supports (float16 or int8 on most hardware) and sorts batches by
+    length internally.
+    """
+
+    @property
+    def ct2_model_path(self) -> Path:
+        """Get the path to the converted CTranslate2 model directory."""
+        return self.model_path.with_name(f"{self.model_path.name}_ct2")
+
+    def download_model(self, force: bool = False) -> Path:
+        """Download the model and convert it to CTranslate2's format.
+
+        Args:
+            force: If True, re-download and re-convert even if files exist.
+
+        Returns:
+            Path to the downloaded model directory.
+
+        Raises:
+            RuntimeError: If download or conversion fails.
+        """
+        model_path = super().download_model(force=force)
+        if force or not (self.ct2_model_path / "model.bin").exists():
+            self._convert(force=force)
+        return model_path
+
+    def _ensure_downloaded(self) -> None:
+        """Download and convert the model, unless both are already present."""
+        if not self.is_downloaded or not (self.ct2_model_path / "model.bin").exists():
+            self.download_model()
+
+    def _convert(self, force: bool = False) -> None:
+        """Convert the downloaded snapshot with the CTranslate2 converter."""
+        from ctranslate2.converters import TransformersConverter
+
+        logger.info(f"Converting model to CTranslate2 at {self.ct2_model_path}")
+        try:
+            TransformersConverter(str(self.model_path)).convert(
+                str(self.ct2_model_path),
+                quantization="float16",
+                force=force,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to convert model at {self.model_path} to CTranslate2: {e}"
+            ) from e
+
+    def _load(self) -> tuple["ctranslate2.Translator", "AutoTokenizer"]:
+        """Load the translator and tokenizer. The caller must hold _load_lock."""
+        import ctranslate2
+        from transformers import AutoTokenizer
+
+        self._ensure_downloaded()
+
+        logger.info(f"Loading CTranslate2 model from {self.ct2_model_path}")
+
+        try:
+            tokenizer: AutoTokenizer = AutoTokenizer.from_pretrained(
+                self.model_path,
+                local_files_only=True,
+            )
+            translator = ctranslate2.Translator(
+                str(self.ct2_model_path),
+                device="auto",
+                compute_type="auto",
+            )
+            logger.info("Model loaded successfully")
+
+            # The translator takes the place of the transformers model
+            self._model = translator
+            self._tokenizer = tokenizer
+            self._is_loaded = True
+
+            return translator, tokenizer
+
+        except Exception as e:
+            logger.error(f"Failed to load model: {e}")
+            self._model = None
+            self._tokenizer = None
+            self._is_loaded = False
+            raise RuntimeError(
+                f"Failed to load model from {self.ct2_model_path}: {e}"
+            ) from e
+
+    def translate_batch(
+        self, texts: list[str], source_lang: str, target_lang: str
+    ) -> list[str]:
+        """Translate several texts in a single CTranslate2 call."""
+        translator, tokenizer = self.load_model()
+        # Setting src_lang rebuilds the tokenizer's special tokens
+        if tokenizer.src_lang != source_lang:
+            tokenizer.src_lang = source_lang
+
+        input_ids = tokenizer(
+            texts,
+            truncation=True,
+            max_length=MAX_INPUT_TOKENS,
+        )["input_ids"]
+        source = [tokenizer.convert_ids_to_tokens(ids) for ids in input_ids]
+
+        results = translator.translate_batch(
+            source,
+            target_prefix=[[target_lang]] * len(texts),
+            beam_size=1,
+            max_batch_size=256,
+            max_decoding_length=MAX_INPUT_TOKENS,
+        )
+        # Each hypothesis starts with the target language token
+        return [
+            tokenizer.decode(
+                tokenizer.convert_tokens_to_ids(result.hypotheses[0][1:]),
+                skip_special_tokens=True,
+            )
+            for result in results
+        ]
+
+    # The streamer hooks into transformers' generate(), so yield whole
+    # translations instead
+    translate_stream = TranslationBackend.translate_stream
+
+    def delete_model(self) -> bool:
+        """Delete the downloaded and converted model from disk.
+
+        Returns:
+            True if deletion was successful or model didn't exist.
+        """
+        import shutil
+
+        deleted = super().delete_model()
+        if self.ct2_model_path.exists():
+            try:
+                shutil.rmtree(self.ct2_model_path)
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to delete model at {self.ct2_model_path}: {e}"
+                ) from e
+        return deleted
+
+
 class TranslateGemmaBackend(TranslationBackend):
     """Backend for Google's TranslateGemma model."""
 
@@ -387,11 +746,21 @@ class TranslateGemmaBackend(TranslationBackend):
             logger.debug("Returning cached model and processor")
             return self._model, self._processor
 
+        with self._load_lock:
+            # Another thread may have finished loading while we waited
+            if (
+                self._is_loaded
+                and self._model is not None
+                and self._processor is not None
+            ):
+                return self._model, self._processor
+            return self._load()
+
+    def _load(self) -> tuple["AutoModelForImageTextToText", "AutoProcessor"]:
+        """Load the model and processor. The caller must hold _load_lock."""
         from transformers import AutoModelForImageTextToText, AutoProcessor
 
-        if not self.is_downloaded:
-            logger.info("Model not found locally, downloading...")
-            self.download_model()
+        self._ensure_downloaded()
 
         logger.info(f"Loading model from {self.model_path}")
 
@@ -431,15 +800,16 @@ class TranslateGemmaBackend(TranslationBackend):
 
     def unload_model(self) -> None:
         """Unload the model from memory to free resources."""
-        if self._model is not None:
-            del self._model
-            self._model = None
+        with self._load_lock:
+            if self._model is not None:
+                del self._model
+                self._model = None
 
-        if self._processor is not None:
-            del self._processor
-            self._processor = None
+            if self._processor is not None:
+                del self._processor
+                self._processor = None
 
-        self._is_loaded = False
+            self._is_loaded = False
         logger.info("Model unloaded from memory")
 
     def translate(self, text: str, source_lang: str, target_lang: str) -> str:
@@ -537,12 +907,17 @@ class ModelManager:
 
     _instance: "ModelManager | None" = None
     _backends: dict[str, TranslationBackend] = {}
+    # Hot translations keyed by (model_id, source_lang, target_lang, text).
+    # Greedy decoding is deterministic, so entries only leave by LRU eviction.
+    _translation_cache: OrderedDict[tuple[str, str, str, str], str] = OrderedDict()
+    _translation_cache_lock = threading.Lock()
 
     def __new__(cls) -> "ModelManager":
         """Ensure only one instance of ModelManager exists."""
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._backends = {}
+            cls._translation_cache = OrderedDict()
         return cls._instance
 
     def __init__(self) -> None:
@@ -577,7 +952,8 @@ class ModelManager:
 
         if model_id not in self._backends:
             if model_id == "nllb":
-                self._backends[model_id] = NLLBBackend(self._cache_dir)
+                backend_cls = CTranslate2NLLBBackend if USE_CTRANSLATE2 else NLLBBackend
+                self._backends[model_id] = backend_cls(self._cache_dir)
             elif model_id == "translategemma":
                 self._backends[model_id] = TranslateGemmaBackend(self._cache_dir)
             else:
@@ -612,6 +988,28 @@ class ModelManager:
         """Load a model into memory."""
         return self.get_backend(model_id).load_model()
 
+    def warm_up(self, model_id: str | None = None) -> bool:
+        """Load a downloaded model and run one translation through it.
+
+        The first generate call pays one-off setup costs such as kernel
+        selection, so running it ahead of time keeps them out of the first
+        real request. Saved and memoized translations are bypassed.
+
+        Args:
+            model_id: The model to warm up. Defaults to the current model.
+
+        Returns:
+            True if the model was warmed up, False if it is not downloaded.
+        """
+        backend = self.get_backend(model_id)
+        if not backend.is_downloaded:
+            return False
+
+        backend.load_model()
+        codes = backend.get_language_codes()
+        backend.translate("Hello", codes["English"], codes["French"])
+        return True
+
     def unload_model(self, model_id: str | None = None) -> None:
         """Unload a model from memory."""
         self.get_backend(model_id).unload_model()
@@ -624,6 +1022,25 @@ class ModelManager:
         """Verify that all necessary model files are present."""
         return self.get_backend(model_id).verify_model_files()
 
+    def get_cached_translation(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_id: str | None = None,
+    ) -> str | None:
+        """Look up a memoized translation without touching the model.
+
+        Returns:
+            The cached translation, or None if it has not been computed yet.
+        """
+        key = (model_id or self._current_model_id, source_lang, target_lang, text)
+        with self._translation_cache_lock:
+            cached = self._translation_cache.get(key)
+            if cached is not None:
+                self._translation_cache.move_to_end(key)
+            return cached
+
     def translate(
         self,
         text: str,
@@ -632,7 +1049,126 @@ class ModelManager:
         model_id: str | None = None,
     ) -> str:
         """Translate text between languages using the specified model."""
-        return self.get_backend(model_id).translate(text, source_lang, target_lang)
+        return self.translate_batch([text], source_lang, target_lang, model_id)[0]
+
+    def translate_batch(
+        self,
+        texts: list[str],
+        source_lang: str,
+        target_lang: str,
+        model_id: str | None = None,
+    ) -> list[str]:
+        """Translate several texts sharing a language pair with the given model.
+
+        Results are memoized in process, and translations the user has already
+        saved are returned without running the model. Only the remaining texts
+        are sent to the backend, in a single batch.
+        """
+        model_id = model_id or self._current_model_id
+        results: list[str | None] = [None] * len(texts)
+        # Indices of each text that still needs a translation
+        pending: dict[str, list[int]] = {}
+
+        with self._translation_cache_lock:
+            for i, text in enumerate(texts):
+                key = (model_id, source_lang, target_lang, text)
+                cached = self._translation_cache.get(key)
+                if cached is not None:
+                    self._translation_cache.move_to_end(key)
+                    results[i] = cached
+                else:
+                    pending.setdefault(text, []).append(i)
+
+        if not pending:
+            return results  # type: ignore[return-value]
+
+        found: dict[str, str] = {}
+        for text in pending:
+            saved = self._find_saved_translation(text, source_lang, target_lang)
+            if saved is not None:
+                found[text] = saved
+
+        to_translate = [text for text in pending if text not in found]
+        if to_translate:
+            translated = self.get_backend(model_id).translate_batch(
+                to_translate, source_lang, target_lang
+            )
+            found.update(zip(to_translate, translated, strict=True))
+
+        self._remember(model_id, source_lang, target_lang, found)
+        for text, translation in found.items():
+            for i in pending[text]:
+                results[i] = translation
+
+        return results  # type: ignore[return-value]
+
+    def translate_stream(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_id: str | None = None,
+        executor: Executor | None = None,
+    ) -> Iterator[str]:
+        """Translate text, yielding the translation in pieces as it is decoded.
+
+        Memoized and saved translations are yielded whole. A completed stream is
+        memoized like any other translation.
+
+        Args:
+            text: The text to translate.
+            source_lang: Source language code.
+            target_lang: Target language code.
+            model_id: The model to translate with. Defaults to the current model.
+            executor: Executor to run generation on. If None, a new thread
+                is used.
+        """
+        model_id = model_id or self._current_model_id
+        cached = self.get_cached_translation(text, source_lang, target_lang, model_id)
+        if cached is None:
+            cached = self._find_saved_translation(text, source_lang, target_lang)
+        if cached is not None:
+            yield cached
+            return
+
+        pieces: list[str] = []
+        for piece in self.get_backend(model_id).translate_stream(
+            text, source_lang, target_lang, executor
+        ):
+            pieces.append(piece)
+            yield piece
+        self._remember(model_id, source_lang, target_lang, {text: "".join(pieces)})
+
+    def _find_saved_translation(
+        self, text: str, source_lang: str, target_lang: str
+    ) -> str | None:
+        """Look up a saved translation, treating database errors as a miss."""
+        try:
+            saved = get_saved_translation_manager().find_by_content(
+                source_text=text,
+                source_lang=source_lang,
+                target_lang=target_lang,
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Saved translation lookup failed: {e}")
+            return None
+        return saved.translated_text if saved is not None else None
+
+    def _remember(
+        self,
+        model_id: str,
+        source_lang: str,
+        target_lang: str,
+        translations: dict[str, str],
+    ) -> None:
+        """Memoize translations, evicting the least recently used entries."""
+        with self._translation_cache_lock:
+            for text, translation in translations.items():
+                self._translation_cache[(model_id, source_lang, target_lang, text)] = (
+                    translation
+                )
+            while len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
+                self._translation_cache.popitem(last=False)
 
     def get_language_codes(self, model_id: str | None = None) -> dict[str, str]:
         """Get the language codes for a specific model."""
@@ -654,17 +1190,11 @@ class ModelManager:
         raise TypeError("get_tokenizer() only supported for NLLB backend")
 
 
-# Global model manager instance
-_model_manager: ModelManager | None = None
-
-
+@functools.cache
 def get_model_manager() -> ModelManager:
     """Get the global ModelManager instance.
 
     Returns:
         The global ModelManager singleton.
     """
-    global _model_manager
-    if _model_manager is None:
-        _model_manager = ModelManager()
-    return _model_manager
+    return ModelManager()
@@ -1,35 +1,39 @@
-import sqlite3
+import functools
 from pathlib import Path
 
-from core.database import DEFAULT_DB_PATH
+from core.database import SQLiteManager
 
+_GET_PREFERENCE_SQL = "SELECT value FROM preferences WHERE key = ?"
+_UPSERT_PREFERENCE_SQL = """
+    INSERT INTO preferences (key, value)
+    VALUES (?, ?)
+    ON CONFLICT(key) DO UPDATE SET value = excluded.value
+"""
+_DELETE_PREFERENCE_SQL = "DELETE FROM preferences WHERE key = ?"
+
+
+class PreferencesManager(SQLiteManager):
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS preferences (
+            key TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+    _SCHEMA_NAME = "preferences"
 
-class PreferencesManager:
     def __init__(self, db_path: Path | str | None = None) -> None:
         """Initialize the PreferencesManager.
 
         Args:
             db_path: Path to the SQLite database file. If None, uses the default path.
         """
-        self._db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
-        self._ensure_database()
-
-    def _ensure_database(self) -> None:
-        """Ensure the database and table exist."""
-        self._db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with self._get_connection() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS preferences (
-                    key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL
-                )
-            """)
-            conn.commit()
-
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        return sqlite3.connect(self._db_path)
+        super().__init__(db_path)
+        # Validated against the database version on every lookup
+        self._get_cache = functools.lru_cache(maxsize=128)(self._get)
+
+    def _clear_caches(self) -> None:
+        """Drop cached preference values."""
+        self._get_cache.cache_clear()
 
     def get(self, key: str) -> str | None:
         """Get a preference value by key.
@@ -40,12 +44,16 @@ class PreferencesManager:
         Returns:
             The preference value, or None if not found.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "SELECT value FROM preferences WHERE key = ?",
-                (key,),
-            )
+        with self._lock:
+            self._validate_caches()
+        return self._get_cache(key)
+
+    def _get(self, key: str) -> str | None:
+        """Query the database for a preference value, bypassing the cache."""
+        with self._lock:
+            cursor = self._get_connection().execute(_GET_PREFERENCE_SQL, (key,))
             row = cursor.fetchone()
+            cursor.close()
             return row[0] if row else None
 
     def set(self, key: str, value: str) -> None:
@@ -55,16 +63,13 @@ class PreferencesManager:
             key: The preference key.
             value: The preference value.
         """
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO preferences (key, value)
-                VALUES (?, ?)
-                ON CONFLICT(key) DO UPDATE SET value = excluded.value
-                """,
+        with self._lock:
+            cursor = self._get_connection().execute(
+                _UPSERT_PREFERENCE_SQL,
                 (key, value),
             )
-            conn.commit()
+            cursor.close()
+            self._record_change()
 
     def delete(self, key: str) -> bool:
         """Delete a preference by key.
@@ -75,25 +80,19 @@ class PreferencesManager:
         Returns:
             True if a preference was deleted, False if not found.
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "DELETE FROM preferences WHERE key = ?",
-                (key,),
-            )
-            conn.commit()
-            return cursor.rowcount > 0
-
-
-_preferences_manager: PreferencesManager | None = None
+        with self._lock:
+            cursor = self._get_connection().execute(_DELETE_PREFERENCE_SQL, (key,))
+            deleted = cursor.rowcount > 0
+            cursor.close()
+            self._record_change()
+            return deleted
 
 
+@functools.cache
 def get_preferences_manager() -> PreferencesManager:
     """Get the global PreferencesManager instance.
 
     Returns:
         The global PreferencesManager singleton.
     """
-    global _preferences_manager
-    if _preferences_manager is None:
-        _preferences_manager = PreferencesManager()
-    return _preferences_manager
+    return PreferencesManager()
@@ -0,0 +1,28 @@
+"""Run the API server with uvicorn.
+
+Usage: python -m server
+
+Configuration is read from the environment:
+- HOST: Interface to bind to. Defaults to 127.0.0.1.
+- PORT: Port to listen on. Defaults to 8000.
+- WEB_CONCURRENCY: Number of worker processes. Defaults to 1, since each
+  worker loads its own copy of the model; only raise it for small CPU models.
+"""
+
+import os
+
+import uvicorn
+
+
+def main() -> None:
+    """Start uvicorn serving the Babelo API."""
+    uvicorn.run(
+        "server.main:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", "8000")),
+        workers=int(os.environ.get("WEB_CONCURRENCY", "1")),
+    )
+
+
+if __name__ == "__main__":
+    main()
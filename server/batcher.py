@@ -0,0 +1,226 @@
+"""Dynamic micro-batching of translation requests.
+
+Concurrent /translate calls are collected for a few milliseconds and sent to
+the model as a single batch per language pair, so one forward pass serves
+several requests instead of each request running the model on its own.
+"""
+
+import asyncio
+import functools
+import itertools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Literal, NamedTuple
+
+from core.model import ModelManager, get_model_manager
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of texts sent to the model in one batch
+MAX_BATCH_SIZE = 32
+
+# Seconds to wait for more requests after the first one arrives
+MAX_BATCH_WAIT = 0.01
+
+# Requests allowed to wait in the queue before new ones are rejected
+MAX_QUEUE_DEPTH = 100
+
+Priority = Literal["HIGH", "MED", "LOW"]
+
+# Queue order of each priority; lower values are served first
+_PRIORITY_RANK: dict[str, int] = {"HIGH": 0, "MED": 1, "LOW": 2}
+
+
+class BatcherOverloadedError(RuntimeError):
+    """Raised when the batcher queue is full and cannot accept more requests."""
+
+
+class PendingTranslation(NamedTuple):
+    """A queued translation request awaiting its batch."""
+
+    text: str
+    source_lang: str
+    target_lang: str
+    model_id: str
+    future: asyncio.Future[str]
+
+
+class TranslationBatcher:
+    """Collects concurrent translation requests into model batches.
+
+    Requests are queued by priority and drained by a background task, which
+    groups them by model and language pair and runs each group through
+    ModelManager.translate_batch on a dedicated worker thread. Requests of the
+    same priority are served in arrival order.
+    """
+
+    def __init__(
+        self,
+        manager: ModelManager,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait: float = MAX_BATCH_WAIT,
+        max_queue_depth: int = MAX_QUEUE_DEPTH,
+    ) -> None:
+        """Initialize the batcher.
+
+        Args:
+            manager: The model manager used to run translations.
+            max_batch_size: Maximum number of requests collected into one batch.
+            max_wait: Seconds to keep collecting after the first request arrives.
+            max_queue_depth: Queued requests allowed before new ones are rejected.
+        """
+        self._manager = manager
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._max_queue_depth = max_queue_depth
+        # Tie-breaker that keeps requests of equal priority in FIFO order
+        self._sequence = itertools.count()
+        # A single worker keeps generate() calls off the event loop and
+        # serialized, since the model is not safe to run concurrently.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model")
+        self._queue: (
+            asyncio.PriorityQueue[tuple[int, int, PendingTranslation]] | None
+        ) = None
+        self._task: asyncio.Task[None] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The single-worker executor that runs model calls."""
+        return self._executor
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting to be batched."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def max_queue_depth(self) -> int:
+        """Number of waiting requests at which new requests are rejected."""
+        return self._max_queue_depth
+
+    def start(self) -> None:
+        """Start the background batching task on the running event loop.
+
+        Does nothing if the task is already running on this loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._queue = asyncio.PriorityQueue()
+        self._task = loop.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the background task and fail any requests still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, _, pending = self._queue.get_nowait()
+                if not pending.future.done():
+                    pending.future.cancel()
+        self._task = None
+        self._queue = None
+        self._loop = None
+
+    async def translate(
+        self,
+        text: str,
+        source_lang: str,
+        target_lang: str,
+        model_id: str,
+        priority: Priority = "MED",
+    ) -> str:
+        """Queue a translation and wait for its batch to complete.
+
+        Args:
+            text: The text to translate.
+            source_lang: Source language code.
+            target_lang: Target language code.
+            model_id: The model to translate with.
+            priority: Scheduling priority. Higher priority requests are batched
+                before lower priority ones waiting in the queue.
+
+        Returns:
+            The translated text.
+
+        Raises:
+            BatcherOverloadedError: If the queue is already full.
+        """
+        self.start()
+        assert self._queue is not None
+        if self._queue.qsize() >= self._max_queue_depth:
+            raise BatcherOverloadedError(
+                f"Translation queue is full ({self._max_queue_depth} requests)"
+            )
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        pending = PendingTranslation(text, source_lang, target_lang, model_id, future)
+        self._queue.put_nowait(
+            (_PRIORITY_RANK[priority], next(self._sequence), pending)
+        )
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue forever, dispatching one batch at a time."""
+        assert self._queue is not None
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            _, _, first = await queue.get()
+            batch = [first]
+            deadline = loop.time() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    _, _, pending = await asyncio.wait_for(queue.get(), remaining)
+                except TimeoutError:
+                    break
+                batch.append(pending)
+            await self._dispatch(batch)
+
+    async def _dispatch(self, batch: list[PendingTranslation]) -> None:
+        """Translate a batch, one model call per model and language pair."""
+        groups: dict[tuple[str, str, str], list[PendingTranslation]] = {}
+        for pending in batch:
+            key = (pending.model_id, pending.source_lang, pending.target_lang)
+            groups.setdefault(key, []).append(pending)
+
+        loop = asyncio.get_running_loop()
+        for (model_id, source_lang, target_lang), group in groups.items():
+            texts = [pending.text for pending in group]
+            try:
+                results = await loop.run_in_executor(
+                    self._executor,
+                    self._manager.translate_batch,
+                    texts,
+                    source_lang,
+                    target_lang,
+                    model_id,
+                )
+            except Exception as e:
+                logger.exception("Batched translation failed")
+                for pending in group:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                continue
+            for pending, result in zip(group, results, strict=True):
+                if not pending.future.done():
+                    pending.future.set_result(result)
+
+
+@functools.cache
+def get_translation_batcher() -> TranslationBatcher:
+    """Get the global TranslationBatcher instance.
+
+    Returns:
+        The global TranslationBatcher singleton.
+    """
+    return TranslationBatcher(get_model_manager())
@@ -1,16 +1,67 @@
-from fastapi import FastAPI
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel
 
+from core.model import get_model_manager
+from server.batcher import get_translation_batcher
 from server.routes.languages import router as languages_router
 from server.routes.model import router as model_router
 from server.routes.preferences import router as preferences_router
 from server.routes.saved import router as saved_router
 from server.routes.translate import router as translate_router
 
+logger = logging.getLogger(__name__)
+
+# The health check body never changes, so it is serialized once
+_ROOT_JSON = orjson.dumps({"status": "ok", "service": "Babelo API"})
+
+
+class RootResponse(BaseModel):
+    """Response model for the health check endpoint."""
+
+    status: str
+    service: str
+
+
+class LoadResponse(BaseModel):
+    """Response model for the translation queue load endpoint."""
+
+    queue_depth: int
+    max_queue_depth: int
+    load: float
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up the model, then run the translation batcher for the app's lifetime.
+
+    The model is loaded before the server accepts traffic, so the first
+    translation does not pay the load cost. Startup continues without it if
+    the model is not downloaded or fails to load.
+    """
+    try:
+        if not await run_in_threadpool(get_model_manager().warm_up):
+            logger.info("Model not downloaded; skipping warm-up")
+    except Exception:
+        logger.exception("Model warm-up failed")
+
+    batcher = get_translation_batcher()
+    batcher.start()
+    yield
+    await batcher.stop()
+
+
 app = FastAPI(
     title="Babelo API",
     description="A FastAPI backend service",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Configure CORS to allow the frontend to make requests
@@ -31,7 +82,22 @@ app.include_router(preferences_router)
 app.include_router(translate_router)
 
 
-@app.get("/")
-async def root():
+@app.get("/", response_model=RootResponse)
+async def root() -> Response:
     """Health check endpoint."""
-    return {"status": "ok", "service": "Babelo API"}
+    return Response(content=_ROOT_JSON, media_type="application/json")
+
+
+@app.get("/load", response_model=LoadResponse)
+async def load() -> LoadResponse:
+    """Report how full the translation queue is.
+
+    A load of 1.0 or more means new translation requests are rejected with
+    503, so load balancers can shed traffic before that happens.
+    """
+    batcher = get_translation_batcher()
+    return LoadResponse(
+        queue_depth=batcher.queue_depth,
+        max_queue_depth=batcher.max_queue_depth,
+        load=batcher.queue_depth / batcher.max_queue_depth,
+    )
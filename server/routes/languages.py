@@ -1,22 +1,46 @@
 """Languages API routes."""
 
-from fastapi import APIRouter, HTTPException, Query
+import functools
 
-from core.model import DEFAULT_MODEL_ID, MODEL_REGISTRY, get_model_manager
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel
+
+from core.languages import get_sorted_language_codes
+from core.model import DEFAULT_MODEL_ID, MODEL_REGISTRY
 
 router = APIRouter(prefix="/languages", tags=["languages"])
 
 
-@router.get("")
+class LanguagesResponse(BaseModel):
+    """Response model for the supported languages of a model."""
+
+    languages: dict[str, str]
+    model_id: str
+
+
+@functools.cache
+def _languages_json(model_id: str) -> bytes:
+    """Serialize the language listing for a model once and reuse the bytes."""
+    return orjson.dumps(
+        {
+            "languages": dict(get_sorted_language_codes(model_id)),
+            "model_id": model_id,
+        }
+    )
+
+
+@router.get("", response_model=LanguagesResponse)
 async def list_languages(
     model_id: str = Query(
         default=DEFAULT_MODEL_ID,
         description="Model ID to get languages for",
     ),
-) -> dict[str, dict[str, str] | str]:
+) -> Response:
     """List all supported languages for a model.
 
     Returns a mapping of language names to their codes for the specified model.
+    The listing never changes at runtime, so it is served as prebuilt JSON.
 
     Args:
         model_id: The model to get languages for. Defaults to 'nllb'.
@@ -28,10 +52,4 @@ async def list_languages(
             f"Available models: {list(MODEL_REGISTRY.keys())}",
         )
 
-    manager = get_model_manager()
-    language_codes = manager.get_language_codes(model_id)
-
-    return {
-        "languages": {name: code for name, code in sorted(language_codes.items())},
-        "model_id": model_id,
-    }
+    return Response(content=_languages_json(model_id), media_type="application/json")
@@ -1,6 +1,8 @@
 """Model API routes."""
 
-from fastapi import APIRouter, HTTPException, Query
+import orjson
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from core.model import (
@@ -132,11 +134,12 @@ async def model_status(
         default=DEFAULT_MODEL_ID,
         description="Model ID to check status for",
     ),
-) -> ModelStatusResponse:
+) -> Response:
     """Show model status.
 
     Returns information about the model including whether it's downloaded
-    and loaded in memory.
+    and loaded in memory. The response is built by the server itself, so it is
+    serialized directly instead of being validated against the response model.
 
     Args:
         model_id: The model to check. Defaults to 'nllb'.
@@ -152,13 +155,18 @@ async def model_status(
     backend = manager.get_backend(model_id)
     info = get_model_info(model_id)
 
-    return ModelStatusResponse(
-        model_id=model_id,
-        model_name=info.repo_id,
-        cache_dir=str(manager.cache_dir),
-        model_path=str(backend.model_path),
-        is_downloaded=backend.is_downloaded,
-        is_loaded=backend.is_loaded,
+    return Response(
+        content=orjson.dumps(
+            {
+                "model_id": model_id,
+                "model_name": info.repo_id,
+                "cache_dir": str(manager.cache_dir),
+                "model_path": str(backend.model_path),
+                "is_downloaded": backend.is_downloaded,
+                "is_loaded": backend.is_loaded,
+            }
+        ),
+        media_type="application/json",
     )
 
 
@@ -168,10 +176,11 @@ async def model_verify(
         default=DEFAULT_MODEL_ID,
         description="Model ID to verify",
     ),
-) -> ModelVerifyResponse:
+) -> Response:
     """Verify model files are present.
 
-    Checks if all required model files exist in the model directory.
+    Checks if all required model files exist in the model directory. Like
+    /model/status, the response skips response model validation.
 
     Args:
         model_id: The model to verify. Defaults to 'nllb'.
@@ -195,11 +204,16 @@ async def model_verify(
     results = backend.verify_model_files()
     all_present = all(results.values())
 
-    return ModelVerifyResponse(
-        model_id=model_id,
-        model_path=str(backend.model_path),
-        all_files_present=all_present,
-        files=results,
+    return Response(
+        content=orjson.dumps(
+            {
+                "model_id": model_id,
+                "model_path": str(backend.model_path),
+                "all_files_present": all_present,
+                "files": results,
+            }
+        ),
+        media_type="application/json",
     )
 
 
@@ -242,7 +256,8 @@ async def model_download(
         )
 
     try:
-        backend.download_model(force=force)
+        # Downloads take minutes; keep the event loop free for other requests
+        await run_in_threadpool(backend.download_model, force=force)
         return ModelDownloadResponse(
             success=True,
             message="Model downloaded successfully.",
@@ -292,7 +307,7 @@ async def model_remove(
         )
 
     try:
-        backend.delete_model()
+        await run_in_threadpool(backend.delete_model)
         return ModelRemoveResponse(
             success=True,
             message="Model removed successfully.",
@@ -1,10 +1,17 @@
 """Saved translations API routes."""
 
-from fastapi import APIRouter, HTTPException
+import logging
+import sqlite3
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from core.database import get_saved_translation_manager
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/saved", tags=["saved"])
 
 
@@ -73,26 +80,18 @@ async def check_saved_translation(
 
 
 @router.get("", response_model=SavedTranslationsListResponse)
-async def list_saved_translations() -> SavedTranslationsListResponse:
+async def list_saved_translations() -> Response:
     """List all saved translations.
 
-    Returns saved translations sorted by timestamp, newest first.
+    Returns saved translations sorted by timestamp, newest first. Rows are
+    serialized straight from the database without building response models.
     """
     manager = get_saved_translation_manager()
-    items = manager.list_all()
-
-    return SavedTranslationsListResponse(
-        items=[
-            SavedTranslationResponse(
-                id=item.id,
-                source_text=item.source_text,
-                translated_text=item.translated_text,
-                source_lang=item.source_lang,
-                target_lang=item.target_lang,
-                timestamp=item.timestamp,
-            )
-            for item in items
-        ]
+    items = manager.list_all_raw()
+
+    return Response(
+        content=orjson.dumps({"items": items}),
+        media_type="application/json",
     )
 
 
@@ -107,23 +106,7 @@ async def create_saved_translation(
     """
     manager = get_saved_translation_manager()
 
-    existing = manager.find_by_content(
-        source_text=request.source_text,
-        source_lang=request.source_lang,
-        target_lang=request.target_lang,
-    )
-
-    if existing:
-        return SavedTranslationResponse(
-            id=existing.id,
-            source_text=existing.source_text,
-            translated_text=existing.translated_text,
-            source_lang=existing.source_lang,
-            target_lang=existing.target_lang,
-            timestamp=existing.timestamp,
-        )
-
-    item = manager.create(
+    item = manager.create_or_get(
         source_text=request.source_text,
         translated_text=request.translated_text,
         source_lang=request.source_lang,
@@ -155,9 +138,15 @@ async def delete_saved_translation(item_id: str) -> DeleteResponse:
 
 @router.delete("", response_model=DeleteResponse)
 async def clear_saved_translations() -> DeleteResponse:
-    """Delete all saved translations."""
+    """Delete all saved translations and reclaim the space they used."""
     manager = get_saved_translation_manager()
 
     count = manager.clear_all()
+    if count:
+        # Deleted pages stay in the file until it is rebuilt
+        try:
+            await run_in_threadpool(manager.vacuum)
+        except sqlite3.OperationalError:
+            logger.warning("Failed to vacuum after clearing saved translations")
 
     return DeleteResponse(success=True, message=f"Deleted {count} saved translations")
@@ -1,9 +1,24 @@
 """Translation API routes."""
 
-from fastapi import APIRouter, HTTPException
+import functools
+import logging
+from collections.abc import Iterator
+from typing import Literal
+
+import orjson
+from fastapi import APIRouter, HTTPException, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from core.languages import get_valid_language_codes
 from core.model import DEFAULT_MODEL_ID, MODEL_REGISTRY, get_model_manager
+from server.batcher import (
+    BatcherOverloadedError,
+    Priority,
+    get_translation_batcher,
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/translate", tags=["translate"])
 
@@ -15,6 +30,7 @@ class TranslateRequest(BaseModel):
     source_language_code: str
     target_language_code: str
     model_id: str | None = None  # Defaults to 'nllb' if not specified
+    priority: Priority = "MED"  # Interactive callers use HIGH, bulk jobs LOW
 
 
 class TranslateResponse(BaseModel):
@@ -27,26 +43,30 @@ class TranslateResponse(BaseModel):
     model_id: str
 
 
-@router.post("", response_model=TranslateResponse)
-async def translate(request: TranslateRequest) -> TranslateResponse:
-    """Translate text between languages.
+@functools.cache
+def _unsupported_language_body(
+    model_id: str, side: Literal["source", "target"]
+) -> bytes:
+    """Build the error body for an unsupported language code once per model."""
+    return orjson.dumps(
+        {
+            "detail": f"Unsupported {side} language code for {model_id}. "
+            f"Use GET /languages?model_id={model_id} to see supported language codes."
+        }
+    )
 
-    Translates the provided text from the source language to the target language
-    using the specified model. The model must be downloaded first using the
-    /model/download endpoint.
 
-    Args:
-        request: The translation request containing:
-            - text: The text to translate
-            - source_language_code: Source language code (format depends on model)
-            - target_language_code: Target language code (format depends on model)
-            - model_id: Model to use ('nllb' or 'translategemma'). Defaults to 'nllb'.
+def _validate_request(request: TranslateRequest) -> str | Response:
+    """Check that the request's model and language codes can be used.
+
+    Unsupported language codes are the common client error, so they are
+    answered with a prebuilt 400 response instead of raising.
 
     Returns:
-        The translated text along with language and model information.
+        The model ID to translate with, or the error response to send back.
 
     Raises:
-        HTTPException: If the model is not downloaded or language code is not supported.
+        HTTPException: If the model is unknown or not downloaded.
     """
     model_id = request.model_id or DEFAULT_MODEL_ID
 
@@ -57,8 +77,7 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
             f"Available models: {list(MODEL_REGISTRY.keys())}",
         )
 
-    manager = get_model_manager()
-    backend = manager.get_backend(model_id)
+    backend = get_model_manager().get_backend(model_id)
 
     if not backend.is_downloaded:
         raise HTTPException(
@@ -68,26 +87,68 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
         )
 
     # Validate language codes for the selected model
-    valid_codes = set(backend.get_language_codes().values())
+    valid_codes = get_valid_language_codes(model_id)
+
+    if request.source_language_code not in valid_codes:
+        side = "source"
+    elif request.target_language_code not in valid_codes:
+        side = "target"
+    else:
+        return model_id
+
+    return Response(
+        content=_unsupported_language_body(model_id, side),
+        status_code=400,
+        media_type="application/json",
+    )
 
-    src_lang = request.source_language_code
-    tgt_lang = request.target_language_code
 
-    if src_lang not in valid_codes:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported source language code for {model_id}: '{src_lang}'. "
-            f"Use GET /languages?model_id={model_id} to see supported language codes.",
-        )
+@router.post("", response_model=TranslateResponse)
+async def translate(request: TranslateRequest) -> TranslateResponse | Response:
+    """Translate text between languages.
 
-    if tgt_lang not in valid_codes:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported target language code for {model_id}: '{tgt_lang}'. "
-            f"Use GET /languages?model_id={model_id} to see supported language codes.",
-        )
+    Translates the provided text from the source language to the target language
+    using the specified model. The model must be downloaded first using the
+    /model/download endpoint.
 
-    translated_text = backend.translate(request.text, src_lang, tgt_lang)
+    Args:
+        request: The translation request containing:
+            - text: The text to translate
+            - source_language_code: Source language code (format depends on model)
+            - target_language_code: Target language code (format depends on model)
+            - model_id: Model to use ('nllb' or 'translategemma'). Defaults to 'nllb'.
+            - priority: Scheduling priority ('HIGH', 'MED' or 'LOW'). Defaults
+              to 'MED'.
+
+    Returns:
+        The translated text along with language and model information.
+
+    Raises:
+        HTTPException: If the model is not downloaded or language code is not
+            supported, or with status 503 if the translation queue is full.
+    """
+    model_id = _validate_request(request)
+    if isinstance(model_id, Response):
+        return model_id
+    src_lang = request.source_language_code
+    tgt_lang = request.target_language_code
+    manager = get_model_manager()
+
+    # Repeated requests are answered from memory without queueing for the model
+    translated_text = manager.get_cached_translation(
+        request.text, src_lang, tgt_lang, model_id
+    )
+    if translated_text is None:
+        # Concurrent requests are batched into a single model call
+        try:
+            translated_text = await get_translation_batcher().translate(
+                request.text, src_lang, tgt_lang, model_id, request.priority
+            )
+        except BatcherOverloadedError as e:
+            raise HTTPException(
+                status_code=503,
+                detail="Server overloaded. Please retry later.",
+            ) from e
 
     return TranslateResponse(
         original_text=request.text,
@@ -96,3 +157,57 @@ async def translate(request: TranslateRequest) -> TranslateResponse:
         target_language_code=tgt_lang,
         model_id=model_id,
     )
+
+
+def _sse_events(pieces: Iterator[str]) -> Iterator[bytes]:
+    """Format translation pieces as server-sent events.
+
+    Each piece is sent as a JSON string in a ``data`` field, followed by a
+    ``done`` event. Errors raised after the response has started are sent as an
+    ``error`` event, since the status code can no longer change.
+    """
+    try:
+        for piece in pieces:
+            yield b"data: " + orjson.dumps(piece) + b"\n\n"
+    except Exception:
+        logger.exception("Streaming translation failed")
+        yield b'event: error\ndata: "Translation failed"\n\n'
+        return
+    yield b"event: done\ndata: \n\n"
+
+
+@router.post(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+async def translate_stream(request: TranslateRequest) -> Response:
+    """Translate text, streaming the translation as server-sent events.
+
+    Pieces of the translation are sent as they are decoded, so clients can
+    render long translations progressively. Streams bypass request batching,
+    but run on the same model worker as batched translations. The request's
+    priority is ignored.
+
+    Args:
+        request: The translation request, as for POST /translate.
+
+    Returns:
+        A text/event-stream response of JSON-encoded translation pieces.
+
+    Raises:
+        HTTPException: If the model is not downloaded or language code is not
+            supported.
+    """
+    model_id = _validate_request(request)
+    if isinstance(model_id, Response):
+        return model_id
+    pieces = get_model_manager().translate_stream(
+        request.text,
+        request.source_language_code,
+        request.target_language_code,
+        model_id,
+        executor=get_translation_batcher().executor,
+    )
+    # Sync iterators are consumed in a worker thread by StreamingResponse
+    return StreamingResponse(_sse_events(pieces), media_type="text/event-stream")
@@ -0,0 +1,50 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from core.database import SavedTranslationManager
+from core.model import ModelManager, get_model_manager
+from core.preferences import PreferencesManager
+
+
+@pytest.fixture(scope="session")
+def model_cache_root(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A cache directory shared by tests that never write model files."""
+    return tmp_path_factory.mktemp("model_cache")
+
+
+@pytest.fixture
+def backend_cache(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A fresh cache directory for tests that create model files."""
+    return tmp_path_factory.mktemp("bk")
+
+
+@pytest.fixture(scope="session")
+def manager() -> ModelManager:
+    """The ModelManager singleton, looked up once for the session."""
+    return get_model_manager()
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Path to a fresh SQLite database file."""
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def saved_manager(db_path: Path) -> Iterator[SavedTranslationManager]:
+    """A SavedTranslationManager backed by a fresh database file."""
+    manager = SavedTranslationManager(db_path)
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def preferences_manager(db_path: Path) -> Iterator[PreferencesManager]:
+    """A PreferencesManager backed by a fresh database file."""
+    manager = PreferencesManager(db_path)
+    yield manager
+    manager.close()
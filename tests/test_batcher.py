@@ -0,0 +1,136 @@
+"""Tests for the translation request batcher."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from server.batcher import BatcherOverloadedError, TranslationBatcher
+
+
+def make_manager() -> MagicMock:
+    """Create a fake ModelManager that upper-cases its inputs."""
+    manager = MagicMock()
+    manager.translate_batch.side_effect = lambda texts, src, tgt, model_id: [
+        text.upper() for text in texts
+    ]
+    return manager
+
+
+class TestTranslationBatcher:
+    """Tests for the TranslationBatcher class."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_batch(self):
+        """Test that concurrent requests for one pair run as a single batch."""
+        manager = make_manager()
+        batcher = TranslationBatcher(manager, max_wait=0.05)
+
+        try:
+            results = await asyncio.gather(
+                *(
+                    batcher.translate(text, "eng_Latn", "fra_Latn", "nllb")
+                    for text in ("one", "two", "three")
+                )
+            )
+        finally:
+            await batcher.stop()
+
+        assert results == ["ONE", "TWO", "THREE"]
+        manager.translate_batch.assert_called_once_with(
+            ["one", "two", "three"], "eng_Latn", "fra_Latn", "nllb"
+        )
+
+    @pytest.mark.asyncio
+    async def test_batches_grouped_by_language_pair(self):
+        """Test that each language pair gets its own model call."""
+        manager = make_manager()
+        batcher = TranslationBatcher(manager, max_wait=0.05)
+
+        try:
+            results = await asyncio.gather(
+                batcher.translate("hello", "eng_Latn", "fra_Latn", "nllb"),
+                batcher.translate("hallo", "deu_Latn", "fra_Latn", "nllb"),
+                batcher.translate("bye", "eng_Latn", "fra_Latn", "nllb"),
+            )
+        finally:
+            await batcher.stop()
+
+        assert results == ["HELLO", "HALLO", "BYE"]
+        assert manager.translate_batch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_size_is_capped(self):
+        """Test that no batch exceeds max_batch_size."""
+        manager = make_manager()
+        batcher = TranslationBatcher(manager, max_batch_size=2, max_wait=0.05)
+
+        try:
+            await asyncio.gather(
+                *(
+                    batcher.translate(str(i), "eng_Latn", "fra_Latn", "nllb")
+                    for i in range(5)
+                )
+            )
+        finally:
+            await batcher.stop()
+
+        sizes = [len(call.args[0]) for call in manager.translate_batch.call_args_list]
+        assert max(sizes) <= 2
+        assert sum(sizes) == 5
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_callers(self):
+        """Test that a failed batch raises in every waiting request."""
+        manager = MagicMock()
+        manager.translate_batch.side_effect = RuntimeError("model failed")
+        batcher = TranslationBatcher(manager)
+
+        try:
+            with pytest.raises(RuntimeError, match="model failed"):
+                await batcher.translate("hello", "eng_Latn", "fra_Latn", "nllb")
+            # The loop keeps serving requests after a failure
+            manager.translate_batch.side_effect = None
+            manager.translate_batch.return_value = ["bonjour"]
+            result = await batcher.translate("hello", "eng_Latn", "fra_Latn", "nllb")
+        finally:
+            await batcher.stop()
+
+        assert result == "bonjour"
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_served_first(self):
+        """Test that queued HIGH requests are batched before LOW ones."""
+        manager = make_manager()
+        batcher = TranslationBatcher(manager, max_batch_size=1)
+
+        try:
+            await asyncio.gather(
+                batcher.translate("low1", "eng_Latn", "fra_Latn", "nllb", "LOW"),
+                batcher.translate("low2", "eng_Latn", "fra_Latn", "nllb", "LOW"),
+                batcher.translate("high", "eng_Latn", "fra_Latn", "nllb", "HIGH"),
+            )
+        finally:
+            await batcher.stop()
+
+        order = [call.args[0] for call in manager.translate_batch.call_args_list]
+        assert order == [["high"], ["low1"], ["low2"]]
+
+    @pytest.mark.asyncio
+    async def test_rejects_requests_when_queue_full(self):
+        """Test that requests beyond max_queue_depth are rejected."""
+        manager = make_manager()
+        batcher = TranslationBatcher(manager, max_queue_depth=1)
+
+        try:
+            results = await asyncio.gather(
+                batcher.translate("one", "eng_Latn", "fra_Latn", "nllb"),
+                batcher.translate("two", "eng_Latn", "fra_Latn", "nllb"),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+        assert results[0] == "ONE"
+        assert isinstance(results[1], BatcherOverloadedError)
+        assert batcher.queue_depth == 0
@@ -0,0 +1,364 @@
+"""Tests for the SQLite-backed storage managers."""
+
+import sqlite3
+import uuid
+from unittest.mock import patch
+
+import pytest
+
+from core import database
+from core.database import SavedTranslationManager
+from core.preferences import PreferencesManager
+
+
+class TestConnection:
+    """Tests for database connection setup."""
+
+    def test_journal_mode_is_wal(self, saved_manager):
+        """Test that connections use WAL journaling."""
+        with saved_manager._get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_synchronous_is_normal(self, preferences_manager):
+        """Test that connections use synchronous=NORMAL."""
+        with preferences_manager._get_connection() as conn:
+            synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        # 1 == NORMAL
+        assert synchronous == 1
+
+    def test_connection_is_reused(self, saved_manager):
+        """Test that the manager keeps a single connection open."""
+        assert saved_manager._get_connection() is saved_manager._get_connection()
+
+        saved_manager.close()
+        assert saved_manager._conn is None
+
+    def test_managers_share_connection_per_file(self, db_path):
+        """Test that managers of the same file share one connection and lock."""
+        saved = SavedTranslationManager(db_path)
+        preferences = PreferencesManager(db_path)
+
+        assert saved._lock is preferences._lock
+        with saved._lock:
+            assert saved._get_connection() is preferences._get_connection()
+
+        saved.close()
+        preferences.set("theme", "dark")
+        assert preferences.get("theme") == "dark"
+        preferences.close()
+
+    def test_close_keeps_connection_open_for_other_managers(self, db_path):
+        """Test that the shared connection is closed by its last manager only."""
+        first = SavedTranslationManager(db_path)
+        second = SavedTranslationManager(db_path)
+        for text in ("One", "Two", "Three"):
+            second.create(text, text, "eng_Latn", "fra_Latn")
+
+        items = second.iter_all()
+        next(items)
+        first.close()
+        assert len(list(items)) == 2
+
+        second.close()
+        assert db_path not in database._shared_connections
+
+
+class TestSchemaSetup:
+    """Tests for skipping schema setup on already initialized databases."""
+
+    def test_schema_setup_skipped_when_sentinel_present(self, db_path):
+        """Test that a second manager does not re-run schema creation."""
+        SavedTranslationManager(db_path).close()
+
+        with patch.object(SavedTranslationManager, "_create_schema") as mock:
+            manager = SavedTranslationManager(db_path)
+
+        mock.assert_not_called()
+        assert manager._conn is None
+
+    def test_schema_recreated_when_database_removed(self, db_path):
+        """Test that a stale sentinel does not hide a missing database."""
+        PreferencesManager(db_path).close()
+        db_path.unlink()
+
+        manager = PreferencesManager(db_path)
+        manager.set("theme", "dark")
+
+        assert manager.get("theme") == "dark"
+
+
+class TestSavedTranslationManager:
+    """Tests for the SavedTranslationManager class."""
+
+    def test_find_by_content_uses_index(self, saved_manager):
+        """Test that find_by_content is served by an index, not a table scan."""
+        cursor = saved_manager._get_connection().execute(
+            """
+            EXPLAIN QUERY PLAN
+            SELECT id FROM saved_translations
+            WHERE source_text = ? AND source_lang = ? AND target_lang = ?
+            """,
+            ("Hello", "eng_Latn", "fra_Latn"),
+        )
+        plan = cursor.fetchall()
+
+        assert any("idx_saved_translations_lookup" in row[-1] for row in plan)
+
+    def test_create_and_find_by_content(self, saved_manager):
+        """Test that a created entry can be found by its content."""
+        # A cached miss must not hide an entry created afterwards
+        assert saved_manager.find_by_content("Hello", "eng_Latn", "fra_Latn") is None
+        item = saved_manager.create("Hello", "Bonjour", "eng_Latn", "fra_Latn")
+
+        found = saved_manager.find_by_content("Hello", "eng_Latn", "fra_Latn")
+
+        assert found == item
+        assert saved_manager.find_by_content("Hello", "eng_Latn", "deu_Latn") is None
+
+    def test_find_by_content_sees_entries_saved_elsewhere(self, db_path):
+        """Test that a cached miss is dropped when another connection saves."""
+        manager = SavedTranslationManager(db_path)
+        assert manager.find_by_content("Hello", "eng_Latn", "fra_Latn") is None
+
+        with sqlite3.connect(db_path) as conn:
+            conn.execute(
+                "INSERT INTO saved_translations VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    uuid.uuid4().bytes,
+                    "Hello",
+                    "Bonjour",
+                    "eng_Latn",
+                    "fra_Latn",
+                    "2024-01-01T00:00:00.000000+00:00",
+                ),
+            )
+        conn.close()
+
+        found = manager.find_by_content("Hello", "eng_Latn", "fra_Latn")
+        assert found is not None
+        assert found.translated_text == "Bonjour"
+
+    def test_create_or_get_returns_existing_entry(self, saved_manager):
+        """Test that saving the same content twice returns the first entry."""
+        first = saved_manager.create_or_get("Hello", "Bonjour", "eng_Latn", "fra_Latn")
+        again = saved_manager.create_or_get("Hello", "Salut", "eng_Latn", "fra_Latn")
+        other = saved_manager.create_or_get("Hello", "Hallo", "eng_Latn", "deu_Latn")
+
+        assert again == first
+        assert other != first
+        assert len(saved_manager.list_all()) == 2
+        with pytest.raises(sqlite3.IntegrityError):
+            saved_manager.create("Hello", "Bonjour", "eng_Latn", "fra_Latn")
+
+    def test_create_many(self, saved_manager):
+        """Test that create_many inserts every row in order."""
+        items = saved_manager.create_many(
+            [
+                ("Hello", "Bonjour", "eng_Latn", "fra_Latn"),
+                ("Goodbye", "Au revoir", "eng_Latn", "fra_Latn"),
+            ]
+        )
+
+        assert [i.source_text for i in items] == ["Hello", "Goodbye"]
+        assert len({i.id for i in items}) == 2
+        assert sorted(saved_manager.list_all()) == sorted(items)
+
+    def test_list_all_raw_matches_list_all(self, saved_manager):
+        """Test that raw rows carry the same values as SavedTranslations."""
+        saved_manager.create("Hello", "Bonjour", "eng_Latn", "fra_Latn")
+        saved_manager.create("Goodbye", "Au revoir", "eng_Latn", "fra_Latn")
+
+        expected = [
+            {
+                "id": item.id,
+                "source_text": item.source_text,
+                "translated_text": item.translated_text,
+                "source_lang": item.source_lang,
+                "target_lang": item.target_lang,
+                "timestamp": item.timestamp,
+            }
+            for item in saved_manager.list_all()
+        ]
+
+        assert saved_manager.list_all_raw() == expected
+
+    def test_iter_all_paginates_newest_first(self, saved_manager):
+        """Test that iter_all honours limit and keyset pagination."""
+        for text in ("one", "two", "three"):
+            saved_manager.create(text, text.upper(), "eng_Latn", "fra_Latn")
+
+        first_page = list(saved_manager.iter_all(limit=2))
+        assert [i.source_text for i in first_page] == ["three", "two"]
+
+        next_page = list(saved_manager.iter_all(before_ts=first_page[-1].timestamp))
+        assert [i.source_text for i in next_page] == ["one"]
+
+    def test_iter_all_paginates_entries_saved_together(self, saved_manager):
+        """Test that pagination visits every entry sharing a timestamp once."""
+        created = saved_manager.create_many(
+            [(str(i), str(i), "eng_Latn", "fra_Latn") for i in range(5)]
+        )
+
+        pages = [list(saved_manager.iter_all(limit=2))]
+        while pages[-1]:
+            last = pages[-1][-1]
+            pages.append(
+                list(
+                    saved_manager.iter_all(
+                        limit=2, before_ts=last.timestamp, before_id=last.id
+                    )
+                )
+            )
+
+        seen = [item for page in pages for item in page]
+        assert [len(page) for page in pages] == [2, 2, 1, 0]
+        assert sorted(seen) == sorted(created)
+        assert seen == saved_manager.list_all()
+        assert saved_manager.list_all_raw() == [item._asdict() for item in seen]
+
+    def test_delete_and_clear_all(self, saved_manager):
+        """Test deleting a single entry and clearing all entries."""
+        first = saved_manager.create("Hello", "Bonjour", "eng_Latn", "fra_Latn")
+        saved_manager.create("Goodbye", "Au revoir", "eng_Latn", "fra_Latn")
+
+        assert saved_manager.delete(first.id) is True
+        assert saved_manager.delete(first.id) is False
+        assert saved_manager.delete("not-a-uuid") is False
+        assert saved_manager.clear_all() == 1
+        assert saved_manager.list_all() == []
+        assert saved_manager.clear_all() == 0
+        saved_manager.vacuum()
+
+
+class TestMigrations:
+    """Tests for upgrading databases created by older versions."""
+
+    def test_text_columns_are_converted(self, db_path):
+        """Test that TEXT ids and timestamps are migrated to compact types."""
+        item_id = "6f1c1f5e-8c1a-4c59-9a4e-2f8f4f0f6a11"
+        iso = "2024-05-01T12:30:45.123456+00:00"
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE saved_translations (
+                    id TEXT PRIMARY KEY,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    timestamp TEXT NOT NULL
+                )
+            """)
+            conn.execute(
+                "INSERT INTO saved_translations VALUES (?, ?, ?, ?, ?, ?)",
+                (item_id, "Hello", "Bonjour", "eng_Latn", "fra_Latn", iso),
+            )
+        conn.close()
+
+        manager = SavedTranslationManager(db_path)
+        (item,) = manager.list_all()
+
+        assert item.id == item_id
+        assert item.timestamp == iso
+        assert manager.find_by_content("Hello", "eng_Latn", "fra_Latn") == item
+        assert manager.delete(item_id) is True
+
+    def test_integer_timestamps_are_converted_to_iso(self, db_path):
+        """Test that Unix microsecond timestamps become fixed-width ISO strings."""
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE saved_translations (
+                    id BLOB PRIMARY KEY,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL
+                )
+            """)
+            conn.execute(
+                "INSERT INTO saved_translations VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    b"1" * 16,
+                    "Hello",
+                    "Bonjour",
+                    "eng_Latn",
+                    "fra_Latn",
+                    1714566645000000,
+                ),
+            )
+        conn.close()
+
+        manager = SavedTranslationManager(db_path)
+        (item,) = manager.list_all()
+
+        assert item.timestamp == "2024-05-01T12:30:45.000000+00:00"
+
+    def test_duplicates_removed_before_unique_index(self, db_path):
+        """Test that duplicate entries are collapsed to the oldest one."""
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("""
+                CREATE TABLE saved_translations (
+                    id BLOB PRIMARY KEY,
+                    source_text TEXT NOT NULL,
+                    translated_text TEXT NOT NULL,
+                    source_lang TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX idx_saved_translations_lookup
+                ON saved_translations (source_lang, target_lang, source_text)
+            """)
+            conn.executemany(
+                "INSERT INTO saved_translations VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (b"1" * 16, "Hello", "Bonjour", "eng_Latn", "fra_Latn", 1),
+                    (b"2" * 16, "Hello", "Salut", "eng_Latn", "fra_Latn", 2),
+                ],
+            )
+        conn.close()
+
+        manager = SavedTranslationManager(db_path)
+        (item,) = manager.list_all()
+
+        assert item.translated_text == "Bonjour"
+        again = manager.create_or_get("Hello", "Coucou", "eng_Latn", "fra_Latn")
+        assert again == item
+
+
+class TestPreferencesManager:
+    """Tests for the PreferencesManager class."""
+
+    def test_set_get_delete(self, preferences_manager):
+        """Test the preference set/get/delete round trip."""
+
+        assert preferences_manager.get("target_lang") is None
+        preferences_manager.set("target_lang", "fra_Latn")
+        assert preferences_manager.get("target_lang") == "fra_Latn"
+        preferences_manager.set("target_lang", "deu_Latn")
+        assert preferences_manager.get("target_lang") == "deu_Latn"
+        assert preferences_manager.delete("target_lang") is True
+        assert preferences_manager.get("target_lang") is None
+
+    def test_get_sees_writes_from_other_managers(self, db_path):
+        """Test that cached values are dropped when another manager writes."""
+        manager = PreferencesManager(db_path)
+        other = PreferencesManager(db_path)
+
+        assert manager.get("theme") is None
+        other.set("theme", "dark")
+        assert manager.get("theme") == "dark"
+
+    def test_get_sees_writes_from_other_processes(self, db_path):
+        """Test that cached values are dropped when another connection commits."""
+        manager = PreferencesManager(db_path)
+        assert manager.get("theme") is None
+
+        # Stands in for the CLI or another server worker
+        with sqlite3.connect(db_path) as conn:
+            conn.execute("INSERT INTO preferences VALUES ('theme', 'dark')")
+        conn.close()
+
+        assert manager.get("theme") == "dark"
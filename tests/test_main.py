@@ -1,7 +1,13 @@
+from unittest.mock import MagicMock, patch
+
 import pytest
+from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from core.model import ModelManager
+from server.batcher import get_translation_batcher
 from server.main import app
+from server.routes.model import ModelStatusResponse
 
 
 @pytest.mark.asyncio
@@ -18,6 +24,21 @@ async def test_root_returns_ok_status():
     assert data["service"] == "Babelo API"
 
 
+@pytest.mark.asyncio
+async def test_load_endpoint():
+    """Test that the load endpoint reports translation queue usage."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/load")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["queue_depth"] == 0
+    assert data["max_queue_depth"] > 0
+    assert data["load"] == 0.0
+
+
 @pytest.mark.asyncio
 async def test_models_list_endpoint():
     """Test that the models list endpoint returns available models."""
@@ -93,3 +114,200 @@ async def test_model_status_endpoint():
     assert "model_id" in data
     assert "is_downloaded" in data
     assert "is_loaded" in data
+
+
+@pytest.mark.asyncio
+async def test_model_status_matches_documented_schema():
+    """Test that the unvalidated model status body matches its response model."""
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/model/status")
+
+    assert response.headers["content-type"] == "application/json"
+    ModelStatusResponse.model_validate(response.json(), strict=True)
+    assert response.json().keys() == ModelStatusResponse.model_fields.keys()
+
+
+@pytest.mark.asyncio
+async def test_saved_translations_list_endpoint(saved_manager):
+    """Test that saved translations are listed newest first."""
+    saved_manager.create("Hello", "Bonjour", "eng_Latn", "fra_Latn")
+    item = saved_manager.create("Goodbye", "Au revoir", "eng_Latn", "fra_Latn")
+
+    with patch(
+        "server.routes.saved.get_saved_translation_manager",
+        return_value=saved_manager,
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.get("/saved")
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [i["source_text"] for i in items] == ["Goodbye", "Hello"]
+    assert items[0] == {
+        "id": item.id,
+        "source_text": "Goodbye",
+        "translated_text": "Au revoir",
+        "source_lang": "eng_Latn",
+        "target_lang": "fra_Latn",
+        "timestamp": item.timestamp,
+    }
+
+
+@pytest.mark.asyncio
+async def test_saved_translations_clear_endpoint_reclaims_space(saved_manager):
+    """Test that clearing saved translations leaves no free pages behind."""
+    for i in range(200):
+        saved_manager.create(f"Text {i} " * 20, "Texte", "eng_Latn", "fra_Latn")
+
+    with patch(
+        "server.routes.saved.get_saved_translation_manager",
+        return_value=saved_manager,
+    ):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.delete("/saved")
+
+    assert response.status_code == 200
+    assert response.json()["message"] == "Deleted 200 saved translations"
+    with saved_manager._lock:
+        conn = saved_manager._get_connection()
+        (free_pages,) = conn.execute("PRAGMA freelist_count").fetchone()
+    assert free_pages == 0
+
+
+@pytest.mark.asyncio
+async def test_translate_stream_endpoint():
+    """Test that translations are streamed as server-sent events."""
+    manager = MagicMock()
+    manager.get_backend.return_value.is_downloaded = True
+    manager.translate_stream.return_value = iter(["Bon", "jour"])
+
+    with patch("server.routes.translate.get_model_manager", return_value=manager):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/translate/stream",
+                json={
+                    "text": "Hello",
+                    "source_language_code": "eng_Latn",
+                    "target_language_code": "fra_Latn",
+                },
+            )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.text == ('data: "Bon"\n\ndata: "jour"\n\nevent: done\ndata: \n\n')
+
+
+@pytest.mark.asyncio
+async def test_translate_stream_rejects_unknown_language():
+    """Test that streaming validates language codes before starting."""
+    manager = MagicMock()
+    manager.get_backend.return_value.is_downloaded = True
+
+    with patch("server.routes.translate.get_model_manager", return_value=manager):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/translate/stream",
+                json={
+                    "text": "Hello",
+                    "source_language_code": "eng_Latn",
+                    "target_language_code": "xx",
+                },
+            )
+
+    assert response.status_code == 400
+    manager.translate_stream.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_translate_rejects_unknown_source_language():
+    """Test that an unsupported source language returns a 400 with a detail."""
+    manager = MagicMock()
+    manager.get_backend.return_value.is_downloaded = True
+
+    with patch("server.routes.translate.get_model_manager", return_value=manager):
+        async with AsyncClient(
+            transport=ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/translate",
+                json={
+                    "text": "Hello",
+                    "source_language_code": "xx",
+                    "target_language_code": "fra_Latn",
+                },
+            )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith(
+        "Unsupported source language code for nllb."
+    )
+    manager.get_cached_translation.assert_not_called()
+
+
+@pytest.fixture
+def translate_manager():
+    """Serve /translate from a downloaded model with an empty memo."""
+    manager = MagicMock()
+    manager.get_backend.return_value.is_downloaded = True
+    manager.get_cached_translation.return_value = None
+
+    with (
+        patch("server.routes.translate.get_model_manager", return_value=manager),
+        patch.object(ModelManager, "warm_up", return_value=False),
+    ):
+        yield manager
+
+
+def test_translate_endpoint_runs_through_batcher(translate_manager):
+    """Test that /translate is served by the batcher started in the lifespan."""
+    with (
+        patch.object(
+            ModelManager, "translate_batch", return_value=["Bonjour"]
+        ) as translate_batch,
+        TestClient(app) as client,
+    ):
+        response = client.post(
+            "/translate",
+            json={
+                "text": "Hello",
+                "source_language_code": "eng_Latn",
+                "target_language_code": "fra_Latn",
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.json()["translated_text"] == "Bonjour"
+    translate_batch.assert_called_once_with(["Hello"], "eng_Latn", "fra_Latn", "nllb")
+
+
+def test_translate_endpoint_returns_503_when_overloaded(translate_manager):
+    """Test that a full translation queue is reported as 503."""
+    batcher = get_translation_batcher()
+
+    with (
+        patch.object(batcher, "_max_queue_depth", 0),
+        patch.object(ModelManager, "translate_batch") as translate_batch,
+        TestClient(app) as client,
+    ):
+        response = client.post(
+            "/translate",
+            json={
+                "text": "Hello",
+                "source_language_code": "eng_Latn",
+                "target_language_code": "fra_Latn",
+            },
+        )
+
+    assert response.status_code == 503
+    assert response.json()["detail"] == "Server overloaded. Please retry later."
+    translate_batch.assert_not_called()
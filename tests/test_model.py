@@ -1,26 +1,86 @@
 """Tests for the model management module."""
 
-import tempfile
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import NamedTuple
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
+from core.languages import (
+    NLLB_LANGUAGE_CODES,
+    TRANSLATEGEMMA_LANGUAGE_CODES,
+    get_language_codes,
+    get_language_names,
+    get_sorted_language_codes,
+    get_valid_language_codes,
+)
 from core.model import (
     DEFAULT_MODEL_ID,
     MODEL_REGISTRY,
+    CTranslate2NLLBBackend,
     ModelManager,
     NLLBBackend,
     TranslateGemmaBackend,
+    TranslationBackend,
     get_available_models,
     get_model_info,
     get_model_manager,
 )
-from core.languages import (
-    NLLB_LANGUAGE_CODES,
-    TRANSLATEGEMMA_LANGUAGE_CODES,
-    get_language_codes,
-)
+
+_EXPECTED_DEFAULT_CACHE = Path.home() / ".cache" / "bab" / "models"
+
+# Directory each model is downloaded to inside the cache directory
+_EXPECTED_DIRS = {
+    "nllb": "facebook--nllb-200-distilled-600M",
+    "translategemma": "google--translategemma-4b-it",
+}
+
+
+@pytest.fixture(scope="module")
+def mock_model():
+    """A stand-in model for tests that only check identity."""
+    return object()
+
+
+@pytest.fixture(scope="module")
+def mock_tokenizer():
+    """A stand-in tokenizer for tests that only check identity."""
+    return object()
+
+
+@pytest.fixture
+def present_files(monkeypatch):
+    """Make Path.exists report only the paths added to the returned set."""
+    present: set[Path] = set()
+    monkeypatch.setattr(Path, "exists", lambda self, **kwargs: self in present)
+    return present
+
+
+@pytest.fixture
+def fresh_nllb(monkeypatch):
+    """An NLLBBackend with no model or tokenizer loaded."""
+    backend = NLLBBackend()
+    monkeypatch.setattr(backend, "_is_loaded", False)
+    monkeypatch.setattr(backend, "_model", None)
+    monkeypatch.setattr(backend, "_tokenizer", None)
+    return backend
+
+
+@pytest.fixture
+def loaded_backend(monkeypatch, mock_model, mock_tokenizer):
+    """An NLLBBackend whose model and tokenizer are already loaded."""
+    backend = NLLBBackend()
+    monkeypatch.setattr(backend, "_model", mock_model)
+    monkeypatch.setattr(backend, "_tokenizer", mock_tokenizer)
+    monkeypatch.setattr(backend, "_is_loaded", True)
+    return backend
 
 
 class TestModelRegistry:
@@ -66,283 +126,522 @@ class TestModelRegistry:
 class TestLanguageCodes:
     """Tests for language code mappings."""
 
-    def test_nllb_language_codes_not_empty(self):
-        """Test that NLLB language codes are populated."""
-        assert len(NLLB_LANGUAGE_CODES) > 0
-        assert "English" in NLLB_LANGUAGE_CODES
-        assert NLLB_LANGUAGE_CODES["English"] == "eng_Latn"
-
-    def test_translategemma_language_codes_not_empty(self):
-        """Test that TranslateGemma language codes are populated."""
-        assert len(TRANSLATEGEMMA_LANGUAGE_CODES) > 0
-        assert "English" in TRANSLATEGEMMA_LANGUAGE_CODES
-        assert TRANSLATEGEMMA_LANGUAGE_CODES["English"] == "en"
-
-    def test_get_language_codes_nllb(self):
-        """Test getting language codes for NLLB."""
-        codes = get_language_codes("nllb")
-        assert codes == NLLB_LANGUAGE_CODES
-
-    def test_get_language_codes_translategemma(self):
-        """Test getting language codes for TranslateGemma."""
-        codes = get_language_codes("translategemma")
-        assert codes == TRANSLATEGEMMA_LANGUAGE_CODES
+    @pytest.mark.parametrize(
+        ("model_id", "expected", "english_code"),
+        [
+            pytest.param("nllb", NLLB_LANGUAGE_CODES, "eng_Latn", id="nllb"),
+            pytest.param(
+                "translategemma", TRANSLATEGEMMA_LANGUAGE_CODES, "en", id="gemma"
+            ),
+        ],
+    )
+    def test_get_language_codes(self, model_id, expected, english_code):
+        """Test that each model's language codes are populated and returned."""
+        codes = get_language_codes(model_id)
+        assert codes is expected
+        assert len(codes) > 0
+        assert codes["English"] == english_code
 
     def test_get_language_codes_unknown(self):
         """Test that unknown model_id raises ValueError."""
         with pytest.raises(ValueError, match="Unknown model_id"):
             get_language_codes("unknown")
 
+    def test_get_language_names(self):
+        """Test that language names can be looked up by code."""
+        names = get_language_names("nllb")
+        assert names["eng_Latn"] == "English"
+        assert get_language_names("translategemma")["en"] == "English"
+        # Built once and shared between calls
+        assert get_language_names("nllb") is names
+
+    def test_get_valid_language_codes(self):
+        """Test that the valid code set matches the model's codes."""
+        codes = get_valid_language_codes("nllb")
+        assert isinstance(codes, frozenset)
+        assert codes == set(NLLB_LANGUAGE_CODES.values())
+        assert get_valid_language_codes("nllb") is codes
+
+    def test_get_sorted_language_codes(self):
+        """Test that languages are returned in name order."""
+        names = list(get_sorted_language_codes("translategemma"))
+        assert names == sorted(TRANSLATEGEMMA_LANGUAGE_CODES)
+
 
 class TestModelManager:
     """Tests for the ModelManager class."""
 
-    def test_singleton_pattern(self):
+    def test_singleton_pattern(self, manager):
         """Test that ModelManager implements singleton pattern."""
-        manager1 = ModelManager()
-        manager2 = ModelManager()
-        assert manager1 is manager2
+        assert ModelManager() is manager
 
-    def test_default_cache_dir(self):
+    def test_default_cache_dir(self, manager):
         """Test that default cache directory is set correctly."""
-        manager = ModelManager()
-        expected = Path.home() / ".cache" / "bab" / "models"
-        assert manager.cache_dir == expected
+        assert manager.cache_dir == _EXPECTED_DEFAULT_CACHE
 
-    def test_custom_cache_dir(self):
+    def test_custom_cache_dir(self, monkeypatch, manager, tmp_path):
         """Test setting a custom cache directory."""
-        manager = ModelManager()
-        original_cache_dir = manager.cache_dir
+        custom_path = tmp_path / "custom_cache"
+        monkeypatch.setattr(manager, "cache_dir", custom_path)
+        assert manager.cache_dir == custom_path
 
-        try:
-            custom_path = Path("/tmp/custom_cache")
-            manager.cache_dir = custom_path
-            assert manager.cache_dir == custom_path
-
-            # Test with string path
-            manager.cache_dir = "/tmp/another_cache"
-            assert manager.cache_dir == Path("/tmp/another_cache")
-        finally:
-            # Restore original
-            manager.cache_dir = original_cache_dir
+        # Test with string path
+        another_path = tmp_path / "another_cache"
+        monkeypatch.setattr(manager, "cache_dir", str(another_path))
+        assert manager.cache_dir == another_path
 
-    def test_get_backend_nllb(self):
+    def test_get_backend_nllb(self, manager):
         """Test getting NLLB backend."""
-        manager = ModelManager()
         backend = manager.get_backend("nllb")
         assert isinstance(backend, NLLBBackend)
 
-    def test_get_backend_translategemma(self):
+    def test_get_backend_translategemma(self, manager):
         """Test getting TranslateGemma backend."""
-        manager = ModelManager()
         backend = manager.get_backend("translategemma")
         assert isinstance(backend, TranslateGemmaBackend)
 
-    def test_get_backend_default(self):
+    def test_get_backend_default(self, manager):
         """Test that default backend is NLLB."""
-        manager = ModelManager()
         backend = manager.get_backend()
         assert isinstance(backend, NLLBBackend)
 
-    def test_get_backend_unknown(self):
+    def test_get_backend_unknown(self, manager):
         """Test that unknown model_id raises ValueError."""
-        manager = ModelManager()
         with pytest.raises(ValueError, match="Unknown model_id"):
             manager.get_backend("unknown")
 
-    def test_get_language_codes_via_manager(self):
+    def test_get_language_codes_via_manager(self, manager):
         """Test getting language codes through the manager."""
-        manager = ModelManager()
         nllb_codes = manager.get_language_codes("nllb")
-        assert nllb_codes == NLLB_LANGUAGE_CODES
+        assert nllb_codes is NLLB_LANGUAGE_CODES
 
         gemma_codes = manager.get_language_codes("translategemma")
-        assert gemma_codes == TRANSLATEGEMMA_LANGUAGE_CODES
+        assert gemma_codes is TRANSLATEGEMMA_LANGUAGE_CODES
+
+
+class BackendCase(NamedTuple):
+    """Expected properties of a translation backend."""
+
+    model_id: str
+    backend_class: type[TranslationBackend]
+    language_codes: dict[str, str]
+    model_dir: str
+    repo_id: str
+    requires_auth: bool
+
+
+BACKEND_CASES = [
+    pytest.param(
+        BackendCase(
+            "nllb",
+            NLLBBackend,
+            NLLB_LANGUAGE_CODES,
+            _EXPECTED_DIRS["nllb"],
+            "facebook/nllb-200-distilled-600M",
+            False,
+        ),
+        id="nllb",
+    ),
+    pytest.param(
+        BackendCase(
+            "translategemma",
+            TranslateGemmaBackend,
+            TRANSLATEGEMMA_LANGUAGE_CODES,
+            _EXPECTED_DIRS["translategemma"],
+            "google/translategemma-4b-it",
+            True,
+        ),
+        id="gemma",
+    ),
+]
+
+
+@pytest.mark.parametrize("case", BACKEND_CASES)
+class TestBackend:
+    """Tests shared by every TranslationBackend."""
+
+    def test_model_path(self, case):
+        """Test that model path is constructed correctly."""
+        backend = case.backend_class()
+        assert backend.model_path.name == case.model_dir
+
+    def test_is_downloaded_false_when_no_directory(self, case, model_cache_root):
+        """Test is_downloaded returns False when directory doesn't exist."""
+        backend = case.backend_class(cache_dir=model_cache_root)
+        assert backend.is_downloaded is False
+
+    def test_requires_auth(self, case):
+        """Test whether the model requires authentication."""
+        backend = case.backend_class()
+        assert backend.model_info.model_id == case.model_id
+        assert backend.model_info.requires_auth is case.requires_auth
+
+    def test_get_language_codes(self, case):
+        """Test getting language codes from backend."""
+        backend = case.backend_class()
+        codes = backend.get_language_codes()
+        assert codes is case.language_codes
 
 
 class TestNLLBBackend:
     """Tests for the NLLBBackend class."""
 
-    def test_model_path(self):
-        """Test that model path is constructed correctly."""
-        backend = NLLBBackend()
-        expected_model_dir = "facebook--nllb-200-distilled-600M"
-        assert backend.model_path.name == expected_model_dir
+    def test_model_path_follows_cache_dir(self):
+        """Test that changing cache_dir updates the cached model path."""
+        backend = NLLBBackend(cache_dir=Path("/tmp/first"))
+        assert backend.model_path.parent == Path("/tmp/first")
 
-    def test_is_downloaded_false_when_no_directory(self):
-        """Test is_downloaded returns False when directory doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            assert backend.is_downloaded is False
+        backend.cache_dir = "/tmp/second"
+        assert backend.model_path.parent == Path("/tmp/second")
 
-    def test_is_downloaded_false_when_missing_files(self):
+    def test_is_downloaded_false_when_missing_files(
+        self, model_cache_root, present_files
+    ):
         """Test is_downloaded returns False when required files are missing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            # Create model directory but without required files
-            backend.model_path.mkdir(parents=True, exist_ok=True)
-            assert backend.is_downloaded is False
-
-    def test_is_downloaded_true_when_files_present(self):
+        backend = NLLBBackend(cache_dir=model_cache_root)
+        # Model directory exists but without required files
+        present_files.add(backend.model_path)
+        assert backend.is_downloaded is False
+
+    def test_is_downloaded_true_when_files_present(
+        self, model_cache_root, present_files
+    ):
         """Test is_downloaded returns True when required files exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            # Create model directory with required files
-            backend.model_path.mkdir(parents=True, exist_ok=True)
-            (backend.model_path / "config.json").touch()
-            assert backend.is_downloaded is True
-
-    def test_is_loaded_initially_false(self):
+        backend = NLLBBackend(cache_dir=model_cache_root)
+        # Model directory exists with required files
+        present_files.update({backend.model_path, backend.model_path / "config.json"})
+        assert backend.is_downloaded is True
+
+    def test_is_loaded_initially_false(self, fresh_nllb):
         """Test that is_loaded is initially False."""
-        backend = NLLBBackend()
-        # Ensure fresh state
-        backend._is_loaded = False
-        backend._model = None
-        backend._tokenizer = None
-        assert backend.is_loaded is False
+        assert fresh_nllb.is_loaded is False
 
-    def test_verify_model_files(self):
+    def test_verify_model_files(self, model_cache_root, present_files):
         """Test verify_model_files returns correct status for each file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            backend.model_path.mkdir(parents=True, exist_ok=True)
+        backend = NLLBBackend(cache_dir=model_cache_root)
 
-            # Create some files but not all
-            (backend.model_path / "config.json").touch()
-            (backend.model_path / "tokenizer_config.json").touch()
+        # Some files present but not all
+        present_files.update(
+            {
+                backend.model_path,
+                backend.model_path / "config.json",
+                backend.model_path / "tokenizer_config.json",
+            }
+        )
 
-            results = backend.verify_model_files()
+        results = backend.verify_model_files()
 
-            assert results["config.json"] is True
-            assert results["tokenizer_config.json"] is True
-            assert results["sentencepiece.bpe.model"] is False
+        assert results["config.json"] is True
+        assert results["tokenizer_config.json"] is True
+        assert results["sentencepiece.bpe.model"] is False
 
-    @patch("core.model.snapshot_download")
-    def test_download_model_skips_if_already_downloaded(self, mock_download):
-        """Test that download is skipped if model already exists."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            # Create model directory with required files
-            backend.model_path.mkdir(parents=True, exist_ok=True)
-            (backend.model_path / "config.json").touch()
+    def test_unload_model(self, fresh_nllb, mock_model, mock_tokenizer):
+        """Test unloading model from memory."""
+        # Simulate loaded state
+        fresh_nllb._model = mock_model
+        fresh_nllb._tokenizer = mock_tokenizer
+        fresh_nllb._is_loaded = True
+
+        fresh_nllb.unload_model()
 
-            result = backend.download_model()
+        assert fresh_nllb._model is None
+        assert fresh_nllb._tokenizer is None
+        assert fresh_nllb._is_loaded is False
 
-            assert result == backend.model_path
-            mock_download.assert_not_called()
 
-    @patch("core.model.snapshot_download")
-    def test_download_model_calls_snapshot_download(self, mock_download):
+class TestDownload:
+    """Tests for downloading models, with the Hugging Face hub mocked."""
+
+    @pytest.fixture(autouse=True)
+    def mock_snapshot(self, monkeypatch):
+        """Replace snapshot_download for every test in the class."""
+        mock = Mock()
+        monkeypatch.setattr("huggingface_hub.snapshot_download", mock)
+        return mock
+
+    @pytest.mark.parametrize("case", BACKEND_CASES)
+    def test_download_model_calls_snapshot_download(
+        self, mock_snapshot, case, model_cache_root
+    ):
         """Test that download calls snapshot_download correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            mock_download.return_value = str(backend.model_path)
+        backend = case.backend_class(cache_dir=model_cache_root)
+        mock_snapshot.return_value = str(backend.model_path)
+
+        backend.download_model()
+
+        mock_snapshot.assert_called_once_with(
+            repo_id=case.repo_id,
+            local_dir=backend.model_path,
+        )
 
+    @pytest.mark.parametrize("case", BACKEND_CASES)
+    def test_download_model_raises_on_failure(
+        self, mock_snapshot, case, model_cache_root
+    ):
+        """Test that download raises RuntimeError on failure."""
+        backend = case.backend_class(cache_dir=model_cache_root)
+        mock_snapshot.side_effect = Exception("Network error")
+
+        with pytest.raises(RuntimeError, match="Failed to download model"):
             backend.download_model()
 
-            mock_download.assert_called_once_with(
-                repo_id="facebook/nllb-200-distilled-600M",
-                local_dir=backend.model_path,
-                local_dir_use_symlinks=False,
-            )
+    def test_download_model_skips_if_already_downloaded(
+        self, mock_snapshot, model_cache_root, present_files
+    ):
+        """Test that download is skipped if model already exists."""
+        backend = NLLBBackend(cache_dir=model_cache_root)
+        # Model directory exists with required files
+        present_files.update({backend.model_path, backend.model_path / "config.json"})
 
-    @patch("core.model.snapshot_download")
-    def test_download_model_force_redownload(self, mock_download):
+        result = backend.download_model()
+
+        assert result == backend.model_path
+        mock_snapshot.assert_not_called()
+
+    def test_download_model_force_redownload(
+        self, mock_snapshot, model_cache_root, present_files
+    ):
         """Test that force=True triggers re-download."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            # Create model directory with required files
-            backend.model_path.mkdir(parents=True, exist_ok=True)
-            (backend.model_path / "config.json").touch()
+        backend = NLLBBackend(cache_dir=model_cache_root)
+        # Model directory exists with required files
+        present_files.update({backend.model_path, backend.model_path / "config.json"})
 
-            mock_download.return_value = str(backend.model_path)
+        mock_snapshot.return_value = str(backend.model_path)
 
-            backend.download_model(force=True)
+        backend.download_model(force=True)
 
-            mock_download.assert_called_once()
+        mock_snapshot.assert_called_once()
 
-    @patch("core.model.snapshot_download")
-    def test_download_model_raises_on_failure(self, mock_download):
-        """Test that download raises RuntimeError on failure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = NLLBBackend(cache_dir=Path(tmpdir))
-            mock_download.side_effect = Exception("Network error")
+    @pytest.mark.parametrize("case", BACKEND_CASES)
+    def test_load_skips_download_when_present(
+        self, case, model_cache_root, present_files
+    ):
+        """Test that loading a downloaded model does not call the download helper."""
+        backend = case.backend_class(cache_dir=model_cache_root)
+        present_files.update({backend.model_path, backend.model_path / "config.json"})
 
-            with pytest.raises(RuntimeError, match="Failed to download model"):
-                backend.download_model()
+        with patch.object(backend, "download_model") as mock_download:
+            backend._ensure_downloaded()
 
-    def test_unload_model(self):
-        """Test unloading model from memory."""
-        backend = NLLBBackend()
+        mock_download.assert_not_called()
 
-        # Simulate loaded state
-        backend._model = MagicMock()
-        backend._tokenizer = MagicMock()
-        backend._is_loaded = True
+    def test_load_downloads_missing_model(self, model_cache_root):
+        """Test that loading a missing model downloads it first."""
+        backend = NLLBBackend(cache_dir=model_cache_root)
 
-        backend.unload_model()
+        with patch.object(backend, "download_model") as mock_download:
+            backend._ensure_downloaded()
 
-        assert backend._model is None
-        assert backend._tokenizer is None
-        assert backend._is_loaded is False
+        mock_download.assert_called_once_with()
 
-    def test_get_language_codes(self):
-        """Test getting language codes from backend."""
-        backend = NLLBBackend()
-        codes = backend.get_language_codes()
-        assert codes == NLLB_LANGUAGE_CODES
+    def test_download_model_auth_error(self, mock_snapshot, model_cache_root):
+        """Test that auth error is handled with helpful message."""
+        backend = TranslateGemmaBackend(cache_dir=model_cache_root)
+        mock_snapshot.side_effect = Exception("401 Unauthorized")
 
+        with pytest.raises(RuntimeError, match="Access denied"):
+            backend.download_model()
 
-class TestTranslateGemmaBackend:
-    """Tests for the TranslateGemmaBackend class."""
 
-    def test_model_path(self):
-        """Test that model path is constructed correctly."""
-        backend = TranslateGemmaBackend()
-        expected_model_dir = "google--translategemma-4b-it"
-        assert backend.model_path.name == expected_model_dir
+class TestManagerTranslate:
+    """Tests for ModelManager.translate memoization."""
+
+    @pytest.fixture(autouse=True)
+    def saved_translations(self, monkeypatch):
+        """Give each test an empty memo and no saved translations."""
+        monkeypatch.setattr(ModelManager, "_translation_cache", OrderedDict())
+        saved_translations = Mock()
+        saved_translations.find_by_content.return_value = None
+        monkeypatch.setattr(
+            "core.model.get_saved_translation_manager", lambda: saved_translations
+        )
+        return saved_translations
+
+    def test_returns_saved_translation_without_model(self, manager, saved_translations):
+        """Test that a saved translation short-circuits the model."""
+        saved = SimpleNamespace(translated_text="Bonjour")
+        saved_translations.find_by_content.return_value = saved
+
+        with patch.object(manager, "get_backend") as mock_backend:
+            result = manager.translate("Hello", "eng_Latn", "fra_Latn", "nllb")
+
+        assert result == "Bonjour"
+        mock_backend.assert_not_called()
+
+    def test_saved_translation_errors_fall_back_to_model(
+        self, manager, saved_translations
+    ):
+        """Test that a failing saved translation lookup does not fail translation."""
+        saved_translations.find_by_content.side_effect = sqlite3.OperationalError(
+            "database is locked"
+        )
+
+        with patch.object(manager, "get_backend") as mock_backend:
+            mock_backend.return_value.translate_batch.return_value = ["Bonjour"]
+            mock_backend.return_value.translate_stream.return_value = iter(["Salut"])
+            result = manager.translate("Hello", "eng_Latn", "fra_Latn", "nllb")
+            streamed = list(manager.translate_stream("Hi", "eng_Latn", "fra_Latn"))
+
+        assert result == "Bonjour"
+        assert streamed == ["Salut"]
+
+    def test_memoizes_model_output(self, manager):
+        """Test that repeated translations only run the model once."""
+        with patch.object(manager, "get_backend") as mock_backend:
+            mock_backend.return_value.translate_batch.return_value = ["Au revoir"]
+            first = manager.translate("Goodbye", "eng_Latn", "fra_Latn", "nllb")
+            second = manager.translate("Goodbye", "eng_Latn", "fra_Latn", "nllb")
+
+        assert first == second == "Au revoir"
+        mock_backend.return_value.translate_batch.assert_called_once()
+
+    def test_get_cached_translation(self, manager):
+        """Test that only translations already computed are returned."""
+        with patch.object(manager, "get_backend") as mock_backend:
+            mock_backend.return_value.translate_batch.return_value = ["Bonjour"]
+            assert (
+                manager.get_cached_translation("Hello", "eng_Latn", "fra_Latn") is None
+            )
+            manager.translate("Hello", "eng_Latn", "fra_Latn", "nllb")
+            cached = manager.get_cached_translation(
+                "Hello", "eng_Latn", "fra_Latn", "nllb"
+            )
 
-    def test_is_downloaded_false_when_no_directory(self):
-        """Test is_downloaded returns False when directory doesn't exist."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = TranslateGemmaBackend(cache_dir=Path(tmpdir))
-            assert backend.is_downloaded is False
+        assert cached == "Bonjour"
+
+    def test_translate_stream_memoizes_result(self, manager):
+        """Test that a finished stream is served from the cache afterwards."""
+        with patch.object(manager, "get_backend") as mock_backend:
+            stream = mock_backend.return_value.translate_stream
+            stream.return_value = iter(["Bon", "jour"])
+            first = list(manager.translate_stream("Hello", "eng_Latn", "fra_Latn"))
+            second = list(manager.translate_stream("Hello", "eng_Latn", "fra_Latn"))
+
+        assert first == ["Bon", "jour"]
+        assert second == ["Bonjour"]
+        stream.assert_called_once()
+
+    def test_batch_only_sends_uncached_texts(self, manager):
+        """Test that cached texts are not sent to the backend again."""
+        with patch.object(manager, "get_backend") as mock_backend:
+            translate_batch = mock_backend.return_value.translate_batch
+            translate_batch.return_value = ["Bonjour"]
+            manager.translate("Hello", "eng_Latn", "fra_Latn", "nllb")
+            translate_batch.return_value = ["Merci"]
+            result = manager.translate_batch(
+                ["Hello", "Thanks", "Thanks"], "eng_Latn", "fra_Latn", "nllb"
+            )
 
-    def test_requires_auth(self):
-        """Test that TranslateGemma requires authentication."""
-        backend = TranslateGemmaBackend()
-        assert backend.model_info.requires_auth is True
+        assert result == ["Bonjour", "Merci", "Merci"]
+        translate_batch.assert_called_with(["Thanks"], "eng_Latn", "fra_Latn")
 
-    def test_get_language_codes(self):
-        """Test getting language codes from backend."""
-        backend = TranslateGemmaBackend()
-        codes = backend.get_language_codes()
-        assert codes == TRANSLATEGEMMA_LANGUAGE_CODES
 
-    @patch("core.model.snapshot_download")
-    def test_download_model_auth_error(self, mock_download):
-        """Test that auth error is handled with helpful message."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            backend = TranslateGemmaBackend(cache_dir=Path(tmpdir))
-            mock_download.side_effect = Exception("401 Unauthorized")
+class TestCTranslate2NLLBBackend:
+    """Tests for the CTranslate2NLLBBackend class."""
+
+    def test_selected_by_feature_flag(self, manager):
+        """Test that the manager serves NLLB through CTranslate2 when enabled."""
+        with (
+            patch("core.model.USE_CTRANSLATE2", True),
+            patch.dict(manager._backends, clear=True),
+        ):
+            backend = manager.get_backend("nllb")
+
+        assert isinstance(backend, CTranslate2NLLBBackend)
 
-            with pytest.raises(RuntimeError, match="Access denied"):
-                backend.download_model()
+    def test_ct2_model_path(self):
+        """Test that converted weights live next to the snapshot."""
+        backend = CTranslate2NLLBBackend(cache_dir=Path("/tmp/cache"))
+        expected_dir = f"{_EXPECTED_DIRS['nllb']}_ct2"
+        assert backend.ct2_model_path == Path("/tmp/cache") / expected_dir
+
+    def test_download_converts_only_once(self, backend_cache):
+        """Test that conversion is skipped once converted weights exist."""
+        backend = CTranslate2NLLBBackend(cache_dir=backend_cache)
+
+        with (
+            patch("core.model.NLLBBackend.download_model"),
+            patch.object(backend, "_convert") as mock_convert,
+        ):
+            backend.download_model()
+            backend.ct2_model_path.mkdir()
+            (backend.ct2_model_path / "model.bin").touch()
+            backend.download_model()
+
+        mock_convert.assert_called_once()
+
+    def test_load_converts_downloaded_snapshot(self, model_cache_root, present_files):
+        """Test that a downloaded but unconverted model still goes through download."""
+        backend = CTranslate2NLLBBackend(cache_dir=model_cache_root)
+        present_files.update({backend.model_path, backend.model_path / "config.json"})
+
+        with patch.object(backend, "download_model") as mock_download:
+            backend._ensure_downloaded()
+            mock_download.assert_called_once_with()
+
+            present_files.add(backend.ct2_model_path / "model.bin")
+            backend._ensure_downloaded()
+            mock_download.assert_called_once_with()
+
+    def test_translate_batch_uses_target_prefix(self):
+        """Test that texts are translated in one call with the target token."""
+        backend = CTranslate2NLLBBackend()
+        translator = Mock()
+        tokenizer = Mock()
+        tokenizer.return_value = {"input_ids": [[1, 2], [3]]}
+        translator.translate_batch.return_value = [
+            SimpleNamespace(hypotheses=[["fra_Latn", "▁Bonjour"]]),
+            SimpleNamespace(hypotheses=[["fra_Latn", "▁Merci"]]),
+        ]
+        tokenizer.decode.side_effect = ["Bonjour", "Merci"]
+
+        with patch.object(backend, "load_model", return_value=(translator, tokenizer)):
+            result = backend.translate_batch(
+                ["Hello", "Thanks"], "eng_Latn", "fra_Latn"
+            )
+
+        assert result == ["Bonjour", "Merci"]
+        assert tokenizer.src_lang == "eng_Latn"
+        translator.translate_batch.assert_called_once()
+        kwargs = translator.translate_batch.call_args.kwargs
+        assert kwargs["target_prefix"] == [["fra_Latn"], ["fra_Latn"]]
+        tokenizer.convert_tokens_to_ids.assert_any_call(["▁Bonjour"])
+
+
+class TestWarmUp:
+    """Tests for ModelManager.warm_up."""
+
+    def test_skips_model_that_is_not_downloaded(self, manager):
+        """Test that warm-up does nothing when the model is missing."""
+        backend = Mock(is_downloaded=False)
+
+        with patch.object(manager, "get_backend", return_value=backend):
+            assert manager.warm_up("nllb") is False
+
+        backend.load_model.assert_not_called()
+
+    def test_loads_and_translates_once(self, manager):
+        """Test that warm-up loads the model and runs one translation."""
+        backend = Mock(is_downloaded=True)
+        backend.get_language_codes.return_value = NLLB_LANGUAGE_CODES
+
+        with patch.object(manager, "get_backend", return_value=backend):
+            assert manager.warm_up("nllb") is True
+
+        backend.load_model.assert_called_once()
+        backend.translate.assert_called_once_with("Hello", "eng_Latn", "fra_Latn")
 
 
 class TestGetModelManager:
     """Tests for the get_model_manager function."""
 
-    def test_returns_model_manager(self):
+    def test_returns_model_manager(self, manager):
         """Test that get_model_manager returns a ModelManager instance."""
-        manager = get_model_manager()
         assert isinstance(manager, ModelManager)
 
-    def test_returns_same_instance(self):
+    def test_returns_same_instance(self, manager):
         """Test that get_model_manager returns the same instance."""
-        manager1 = get_model_manager()
-        manager2 = get_model_manager()
-        assert manager1 is manager2
+        assert get_model_manager() is manager
 
 
 class TestModelLoading:
@@ -351,57 +650,215 @@ class TestModelLoading:
     These tests mock the transformers library to avoid loading the actual model.
     """
 
-    def test_load_model_returns_cached_if_loaded(self):
-        """Test that load_model returns cached instances if already loaded."""
+    @pytest.mark.parametrize(
+        ("attr", "call"),
+        [
+            pytest.param("_model", lambda b: b.load_model()[0], id="load_model"),
+            pytest.param(
+                "_tokenizer", lambda b: b.load_model()[1], id="load_model_tokenizer"
+            ),
+            pytest.param("_model", lambda b: b.get_model(), id="get_model"),
+            pytest.param("_tokenizer", lambda b: b.get_tokenizer(), id="get_tokenizer"),
+        ],
+    )
+    def test_returns_loaded_instances(self, loaded_backend, attr, call):
+        """Test that an already loaded backend returns its cached instances."""
+        assert call(loaded_backend) is getattr(loaded_backend, attr)
+
+    def test_concurrent_load_model_loads_once(self, mock_model, mock_tokenizer):
+        """Test that concurrent load_model calls only load the model once."""
         backend = NLLBBackend()
+        calls = []
 
-        # Simulate already loaded state
-        mock_model = MagicMock()
-        mock_tokenizer = MagicMock()
-        backend._model = mock_model
-        backend._tokenizer = mock_tokenizer
-        backend._is_loaded = True
+        def slow_load():
+            calls.append(1)
+            time.sleep(0.05)
+            backend._model = mock_model
+            backend._tokenizer = mock_tokenizer
+            backend._is_loaded = True
+            return backend._model, backend._tokenizer
 
-        try:
-            model, tokenizer = backend.load_model()
+        with patch.object(backend, "_load", side_effect=slow_load):
+            threads = [threading.Thread(target=backend.load_model) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
 
-            assert model is mock_model
-            assert tokenizer is mock_tokenizer
-        finally:
-            backend._is_loaded = False
-            backend._model = None
-            backend._tokenizer = None
+        assert len(calls) == 1
+
+
+class TestTranslateBatch:
+    """Tests for batched translation."""
+
+    def test_nllb_translate_batch_runs_single_generate(self):
+        """Test that NLLB batches similar-length texts through one generate call."""
+        backend = NLLBBackend()
+        model = Mock()
+        tokenizer = Mock()
+        tokenizer.return_value = {"input_ids": [[1, 2], [1, 2, 3]]}
+        tokenizer.pad.return_value.to.return_value = {"input_ids": "ids"}
+        tokenizer.batch_decode.return_value = ["Bonjour", "Au revoir"]
+
+        with (
+            patch.dict(sys.modules, {"torch": MagicMock()}),
+            patch.object(backend, "load_model", return_value=(model, tokenizer)),
+        ):
+            result = backend.translate_batch(
+                ["Hello", "Goodbye"], "eng_Latn", "fra_Latn"
+            )
 
-    def test_get_model_returns_model(self):
-        """Test that get_model returns the model."""
+        assert result == ["Bonjour", "Au revoir"]
+        assert tokenizer.src_lang == "eng_Latn"
+        tokenizer.assert_called_once()
+        assert tokenizer.call_args.args[0] == ["Hello", "Goodbye"]
+        tokenizer.pad.assert_called_once()
+        tokenizer.pad.return_value.to.assert_called_once_with(model.device)
+        model.generate.assert_called_once()
+
+    def test_nllb_translate_batch_buckets_by_length(self):
+        """Test that short and long texts are generated in separate buckets."""
         backend = NLLBBackend()
+        model = Mock()
+        tokenizer = MagicMock()
+        long_ids = list(range(100))
+        tokenizer.return_value = {"input_ids": [long_ids, [1, 2], [1, 2, 3]]}
+        tokenizer.batch_decode.side_effect = [["long"], ["short", "shorter"]]
+
+        with (
+            patch.dict(sys.modules, {"torch": MagicMock()}),
+            patch.object(backend, "load_model", return_value=(model, tokenizer)),
+        ):
+            result = backend.translate_batch(
+                ["a long text", "Hi", "Hey"], "eng_Latn", "fra_Latn"
+            )
 
-        mock_model = MagicMock()
-        backend._model = mock_model
-        backend._tokenizer = MagicMock()
-        backend._is_loaded = True
+        assert result == ["long", "short", "shorter"]
+        assert model.generate.call_count == 2
+        padded = [call.args[0]["input_ids"] for call in tokenizer.pad.call_args_list]
+        assert padded == [[long_ids], [[1, 2], [1, 2, 3]]]
+
+    def test_nllb_caches_forced_bos_token_id(self):
+        """Test that the target language token id is looked up once."""
+        backend = NLLBBackend()
+        model = Mock()
+        tokenizer = MagicMock()
+        tokenizer.return_value = {"input_ids": [[1, 2]]}
+        tokenizer.batch_decode.return_value = ["Bonjour"]
+        tokenizer.convert_tokens_to_ids.return_value = 42
+
+        with (
+            patch.dict(sys.modules, {"torch": MagicMock()}),
+            patch.object(backend, "load_model", return_value=(model, tokenizer)),
+        ):
+            backend.translate_batch(["Hello"], "eng_Latn", "fra_Latn")
+            backend.translate_batch(["Goodbye"], "eng_Latn", "fra_Latn")
+
+        tokenizer.convert_tokens_to_ids.assert_called_once_with("fra_Latn")
+        assert model.generate.call_args.kwargs["forced_bos_token_id"] == 42
+
+    def test_nllb_load_precomputes_language_token_ids(self):
+        """Test that loading maps every NLLB language code to its token id."""
+        backend = NLLBBackend()
+        transformers = MagicMock()
+        tokenizer = transformers.AutoTokenizer.from_pretrained.return_value
+        tokenizer.convert_tokens_to_ids.side_effect = lambda codes: [
+            len(code) for code in codes
+        ]
+
+        with (
+            patch.dict(
+                sys.modules, {"torch": MagicMock(), "transformers": transformers}
+            ),
+            patch.object(backend, "download_model"),
+        ):
+            backend._load()
 
         try:
-            result = backend.get_model()
-            assert result is mock_model
+            assert backend._lang_token_ids.keys() == set(NLLB_LANGUAGE_CODES.values())
+            assert backend._lang_token_ids["fra_Latn"] == len("fra_Latn")
+            tokenizer.convert_tokens_to_ids.assert_called_once()
         finally:
-            backend._is_loaded = False
-            backend._model = None
-            backend._tokenizer = None
+            backend.unload_model()
+
+        assert backend._lang_token_ids == {}
 
-    def test_get_tokenizer_returns_tokenizer(self):
-        """Test that get_tokenizer returns the tokenizer."""
+    def test_nllb_translate_stream_yields_pieces(self):
+        """Test that streaming runs generate on the executor with a streamer."""
         backend = NLLBBackend()
+        model = Mock()
+        tokenizer = MagicMock()
+        tokenizer.convert_tokens_to_ids.return_value = 42
+        transformers = MagicMock()
+        streamer = transformers.TextIteratorStreamer.return_value
+        streamer.__iter__.return_value = iter(["Bon", "", "jour"])
+        executor = Mock()
+        executor.submit.side_effect = lambda fn: fn()
+
+        with (
+            patch.dict(
+                sys.modules, {"torch": MagicMock(), "transformers": transformers}
+            ),
+            patch.object(backend, "load_model", return_value=(model, tokenizer)),
+        ):
+            pieces = list(
+                backend.translate_stream("Hello", "eng_Latn", "fra_Latn", executor)
+            )
 
-        mock_tokenizer = MagicMock()
-        backend._model = MagicMock()
-        backend._tokenizer = mock_tokenizer
-        backend._is_loaded = True
+        assert pieces == ["Bon", "jour"]
+        assert tokenizer.src_lang == "eng_Latn"
+        executor.submit.assert_called_once()
+        kwargs = model.generate.call_args.kwargs
+        assert kwargs["streamer"] is streamer
+        assert kwargs["forced_bos_token_id"] == 42
 
-        try:
-            result = backend.get_tokenizer()
-            assert result is mock_tokenizer
-        finally:
-            backend._is_loaded = False
-            backend._model = None
-            backend._tokenizer = None
+    def test_default_translate_stream_yields_whole_translation(self):
+        """Test that backends without streaming yield one piece."""
+        backend = TranslateGemmaBackend()
+
+        with patch.object(backend, "translate", return_value="Bonjour"):
+            pieces = list(backend.translate_stream("Hello", "en", "fr"))
+
+        assert pieces == ["Bonjour"]
+
+    def test_default_translate_stream_runs_on_executor(self):
+        """Test that backends without streaming translate on the given executor."""
+        backend = TranslateGemmaBackend()
+        caller = threading.get_ident()
+        threads = []
+
+        def translate(text, src, tgt):
+            threads.append(threading.get_ident())
+            return "Bonjour"
+
+        with (
+            ThreadPoolExecutor(max_workers=1) as executor,
+            patch.object(backend, "translate", side_effect=translate),
+        ):
+            pieces = list(backend.translate_stream("Hello", "en", "fr", executor))
+
+        assert pieces == ["Bonjour"]
+        assert threads and threads[0] != caller
+
+    def test_nllb_translate_uses_batch(self):
+        """Test that single translation goes through translate_batch."""
+        backend = NLLBBackend()
+
+        with patch.object(
+            backend, "translate_batch", return_value=["Bonjour"]
+        ) as mock_batch:
+            result = backend.translate("Hello", "eng_Latn", "fra_Latn")
+
+        assert result == "Bonjour"
+        mock_batch.assert_called_once_with(["Hello"], "eng_Latn", "fra_Latn")
+
+    def test_default_translate_batch_loops(self):
+        """Test that backends without batching translate each text."""
+        backend = TranslateGemmaBackend()
+
+        with patch.object(
+            backend, "translate", side_effect=lambda text, src, tgt: text.upper()
+        ):
+            result = backend.translate_batch(["a", "b"], "en", "fr")
+
+        assert result == ["A", "B"]